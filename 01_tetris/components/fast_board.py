@@ -0,0 +1,102 @@
+"""Compiled board kernels for fast lock-and-score simulation."""
+
+try:
+    import numpy as np
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; kernels run as plain Python
+    np = None
+    HAVE_NUMBA = False
+    
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function uncompiled."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, nogil=True)
+def _popcount(value):
+    """Count set bits of a non-negative integer."""
+    count = 0
+    while value:
+        value &= value - 1
+        count += 1
+    return count
+
+
+@njit(cache=True, nogil=True)
+def _collides(row_bits, shifted, y, height):
+    """Check whether shifted piece rows collide when the piece top is at y."""
+    for i in range(len(shifted)):
+        mask = shifted[i]
+        if mask == 0:
+            continue
+        board_y = y + i
+        if board_y >= height:
+            return True
+        if board_y >= 0 and row_bits[board_y] & mask:
+            return True
+    return False
+
+
+@njit(cache=True, nogil=True)
+def drop_y(row_bits, shifted, y, height):
+    """Return the landing row for shifted piece rows starting at y."""
+    while not _collides(row_bits, shifted, y + 1, height):
+        y += 1
+    return y
+
+
+@njit(cache=True, nogil=True)
+def lock_and_score(row_bits, masks, x, y, width, height):
+    """Drop a piece from (x, y), lock it and clear full rows.
+
+    row_bits is modified in place. masks are the piece's unshifted row
+    bitmasks. Returns (lines_cleared, holes, stack_height).
+    """
+    shifted = masks.copy()
+    for i in range(len(masks)):
+        shifted[i] = masks[i] << x if x >= 0 else masks[i] >> -x
+
+    # Find the landing row
+    y = drop_y(row_bits, shifted, y, height)
+
+    # Lock the piece
+    for i in range(len(shifted)):
+        board_y = y + i
+        if shifted[i] and 0 <= board_y < height:
+            row_bits[board_y] |= shifted[i]
+
+    # Compact surviving rows downwards with a write pointer
+    full_mask = (1 << width) - 1
+    write = height - 1
+    for read in range(height - 1, -1, -1):
+        if row_bits[read] != full_mask:
+            row_bits[write] = row_bits[read]
+            write -= 1
+    lines_cleared = write + 1
+    for i in range(lines_cleared):
+        row_bits[i] = 0
+
+    # Holes are empty cells under any filled cell of the same column
+    holes = 0
+    covered = 0
+    stack_height = 0
+    for row in range(height):
+        bits = row_bits[row]
+        if bits and stack_height == 0:
+            stack_height = height - row
+        holes += _popcount(covered & ~bits & full_mask)
+        covered |= bits
+
+    return lines_cleared, holes, stack_height
+
+
+def warm_up() -> None:
+    """Compile the kernels on a tiny board so the first game frame does not stall."""
+    if not HAVE_NUMBA:
+        return
+    rows = np.zeros(2, dtype=np.int64)
+    masks = np.ones(1, dtype=np.int64)
+    lock_and_score(rows, masks, 0, 0, 1, 2)
@@ -1,26 +1,61 @@
 """Refactored game board implementation with new architecture."""
 
-from typing import List, Optional
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple
 from interfaces.game_interfaces import IGameBoard
 from core.game_state import TetrominoState
 from core.config_manager import ConfigManager
 from core.dependency_injection import Injectable, Container
 from core.event_system import EventType, get_event_bus
-from core.logger import get_logger, get_error_handler
+from core.logger import LogLevel, get_logger, get_error_handler
+from components.fast_board import lock_and_score, warm_up
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; statistics fall back to bitmasks
+    np = None
 
 
 class GameBoard(IGameBoard, Injectable):
     """Game board implementation with dependency injection and event system."""
     
+    __slots__ = (
+        'logger', 'error_handler', 'event_bus', 'config_manager',
+        'ghost_color', 'width', 'height', 'full_mask', 'row_bits', 'row_color', 'col_occ',
+        '_dirty_rows', '_shift_cache', '_ghost_cache', '_ghost_cache_ver', '_version', '_snapshot', '_snapshot_ver',
+        '_np_board', '_np_board_ver',
+    )
+    
     def __init__(self):
         self.config_manager: ConfigManager = None
         self.logger = get_logger()
         self.error_handler = get_error_handler()
         self.event_bus = get_event_bus()
         
+        self.ghost_color: int = 8
         self.width: int = 10
         self.height: int = 20
-        self.board: List[List[int]] = []
+        self.full_mask: int = 0
+        self.row_bits: List[int] = []
+        self.row_color: List[bytearray] = []
+        self.col_occ: List[int] = []
+        
+        # Rows touched since the last line clear; None means scan everything
+        self._dirty_rows: Optional[range] = None
+        
+        # Piece row masks shifted to board columns, keyed by (row_masks, x)
+        self._shift_cache: Dict[Tuple[Tuple[int, ...], int], Optional[Tuple[int, ...]]] = {}
+        
+        # Ghost landing rows keyed by (row_masks, x, y), valid for one _version
+        self._ghost_cache: Dict[Tuple[Tuple[int, ...], int, int], int] = {}
+        self._ghost_cache_ver: int = -1
+        
+        # Read-only snapshot of row_color, rebuilt when _version changes
+        self._version: int = 0
+        self._snapshot: Tuple[Tuple[int, ...], ...] = ()
+        self._snapshot_ver: int = -1
+        self._np_board = None
+        self._np_board_ver: int = -1
     
     def initialize(self, container: Container) -> None:
         """Initialize with dependencies from container."""
@@ -30,10 +65,14 @@ class GameBoard(IGameBoard, Injectable):
         game_config = self.config_manager.game
         self.width = game_config.board_width
         self.height = game_config.board_height
+        self.ghost_color = self.config_manager.display.colors.get("ghost", 8)
         
         # Initialize board
         self.initialize_board(self.width, self.height)
         
+        # Pay any JIT compile cost now rather than on the first lock
+        warm_up()
+        
         self.logger.info(f"GameBoard initialized with size {self.width}x{self.height}")
     
     def initialize_board(self, width: int, height: int) -> None:
@@ -46,48 +85,73 @@ class GameBoard(IGameBoard, Injectable):
         
         self.width = width
         self.height = height
-        self.board = [[0 for _ in range(width)] for _ in range(height)]
+        self.full_mask = (1 << width) - 1
+        self.row_bits = [0] * height
+        self.row_color = [bytearray(width) for _ in range(height)]
+        self.col_occ = [0] * width
+        self._dirty_rows = range(0)
+        self._shift_cache = {}
+        self._version += 1
         
         # Publish board initialization event
-        self.event_bus.publish_event(
-            EventType.BOARD_UPDATED,
-            {"action": "initialized", "width": width, "height": height},
-            "GameBoard"
-        )
+        if self.event_bus.has_subscribers(EventType.BOARD_UPDATED):
+            self.event_bus.publish_event(
+                EventType.BOARD_UPDATED,
+                {"action": "initialized", "width": width, "height": height},
+                "GameBoard"
+            )
         
         self.logger.debug(f"Board initialized with dimensions {width}x{height}")
     
     def get_board(self) -> List[List[int]]:
         """Get current board state."""
-        return [row[:] for row in self.board]  # Return deep copy
+        return [list(row) for row in self._peek_board()]  # Return deep copy
+    
+    def _peek_board(self) -> Tuple[Tuple[int, ...], ...]:
+        """Get an immutable snapshot of the board without copying per call."""
+        if self._snapshot_ver != self._version:
+            self._snapshot = tuple(tuple(row) for row in self.row_color)
+            self._snapshot_ver = self._version
+        return self._snapshot
     
     def is_valid_position(self, piece: TetrominoState) -> bool:
         """Check if piece position is valid on board."""
+        return self.is_valid_offset(piece, 0, 0)
+    
+    def is_valid_offset(self, piece: TetrominoState, dx: int, dy: int) -> bool:
+        """Check if piece would be valid moved by (dx, dy), without building it."""
         if not piece or not piece.shape:
             return False
         
-        try:
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:  # If this cell is occupied in the piece
-                        board_x = piece.x + col_idx
-                        board_y = piece.y + row_idx
-                        
-                        # Check bounds
-                        if board_x < 0 or board_x >= self.width:
-                            return False
-                        if board_y >= self.height:
-                            return False
-                        
-                        # Check collision with existing pieces (but allow above board)
-                        if board_y >= 0 and self.board[board_y][board_x] != 0:
-                            return False
-            
-            return True
-            
-        except (IndexError, AttributeError) as e:
-            self.error_handler.handle_error(e, "validating piece position")
+        # Reject wall and floor hits before touching the board
+        x = piece.x + dx
+        y = piece.y + dy
+        min_dx, max_dx, max_dy = piece.extents
+        if x + min_dx < 0 or x + max_dx >= self.width or y + max_dy >= self.height:
             return False
+        
+        shifted_rows = self._shifted_masks(piece.row_masks, x)
+        if shifted_rows is None:
+            return False
+        
+        row_bits = self.row_bits
+        board_y = y - 1
+        for shifted in shifted_rows:
+            board_y += 1
+            if not shifted:
+                continue
+            
+            # Check collision with existing pieces (but allow above board)
+            if board_y >= 0 and row_bits[board_y] & shifted:
+                return False
+        
+        return True
+    
+    def in_bounds(self, piece: TetrominoState) -> bool:
+        """Check piece cells against the walls and floor only."""
+        min_dx, max_dx, max_dy = piece.extents
+        return (piece.x + min_dx >= 0 and piece.x + max_dx < self.width and
+                piece.y + max_dy < self.height)
     
     def place_piece(self, piece: TetrominoState) -> None:
         """Place piece on the board."""
@@ -95,30 +159,43 @@ class GameBoard(IGameBoard, Injectable):
             raise ValueError("Cannot place piece at invalid position")
         
         try:
-            placed_cells = []
+            for dx, dy in piece.cells:
+                board_x = piece.x + dx
+                board_y = piece.y + dy
+                
+                if 0 <= board_y < self.height:
+                    self.row_bits[board_y] |= 1 << board_x
+                    self.row_color[board_y][board_x] = piece.color
+                    self.col_occ[board_x] |= 1 << (self.height - 1 - board_y)
+            
+            # Only rows covered by the piece can have become complete
+            top = max(0, piece.y)
+            bottom = min(self.height, piece.y + len(piece.row_masks))
+            dirty = self._dirty_rows
+            if dirty:
+                top, bottom = min(top, dirty.start), max(bottom, dirty.stop)
+            self._dirty_rows = range(top, bottom) if dirty is not None else None
             
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = piece.x + col_idx
-                        board_y = piece.y + row_idx
-                        
-                        if 0 <= board_y < self.height and 0 <= board_x < self.width:
-                            self.board[board_y][board_x] = piece.color
-                            placed_cells.append((board_x, board_y))
+            self._version += 1
             
             # Publish piece placement event
-            self.event_bus.publish_event(
-                EventType.PIECE_LOCKED,
-                {
-                    "piece_type": piece.shape_type,
-                    "position": (piece.x, piece.y),
-                    "cells_placed": placed_cells
-                },
-                "GameBoard"
-            )
+            if self.event_bus.has_subscribers(EventType.PIECE_LOCKED):
+                placed_cells = [
+                    (piece.x + dx, piece.y + dy) for dx, dy in piece.cells
+                    if 0 <= piece.y + dy < self.height
+                ]
+                self.event_bus.publish_event(
+                    EventType.PIECE_LOCKED,
+                    {
+                        "piece_type": piece.shape_type,
+                        "position": (piece.x, piece.y),
+                        "cells_placed": placed_cells
+                    },
+                    "GameBoard"
+                )
             
-            self.logger.debug(f"Placed {piece.shape_type} at ({piece.x}, {piece.y})")
+            if self.logger.is_enabled_for(LogLevel.DEBUG):
+                self.logger.debug(f"Placed {piece.shape_type} at ({piece.x}, {piece.y})")
             
         except Exception as e:
             self.error_handler.handle_error(e, "placing piece on board")
@@ -126,40 +203,55 @@ class GameBoard(IGameBoard, Injectable):
     
     def clear_completed_lines(self) -> int:
         """Clear completed lines and return count."""
-        lines_cleared = 0
-        cleared_lines = []
-        
         try:
+            full_mask = self.full_mask
+            
             # Find completed lines from bottom to top
-            y = self.height - 1
-            while y >= 0:
-                if self._is_line_complete(y):
-                    # Remove the line and add empty line at top
-                    del self.board[y]
-                    self.board.insert(0, [0 for _ in range(self.width)])
-                    lines_cleared += 1
-                    cleared_lines.append(y)
-                    # Don't decrement y since we removed a line
-                else:
-                    y -= 1
+            candidate_rows = self._dirty_rows
+            if candidate_rows is None:
+                candidate_rows = range(self.height)
+            cleared_lines = [
+                y for y in reversed(candidate_rows)
+                if self.row_bits[y] == full_mask
+            ]
+            lines_cleared = len(cleared_lines)
+            self._dirty_rows = range(0)
             
             if lines_cleared > 0:
+                # Compact surviving rows downwards in place; rows below
+                # the lowest cleared line stay where they are
+                row_bits = self.row_bits
+                row_color = self.row_color
+                write = cleared_lines[0]
+                for read in range(write, -1, -1):
+                    if row_bits[read] != full_mask:
+                        row_bits[write] = row_bits[read]
+                        row_color[write] = row_color[read]
+                        write -= 1
+                for y in range(write + 1):
+                    row_bits[y] = 0
+                    row_color[y] = bytearray(self.width)
+                self._rebuild_column_masks()
+                self._version += 1
+                
                 # Publish line clear event
-                self.event_bus.publish_event(
-                    EventType.LINES_CLEARED,
-                    {
-                        "lines_cleared": lines_cleared,
-                        "line_positions": cleared_lines
-                    },
-                    "GameBoard"
-                )
+                if self.event_bus.has_subscribers(EventType.LINES_CLEARED):
+                    self.event_bus.publish_event(
+                        EventType.LINES_CLEARED,
+                        {
+                            "lines_cleared": lines_cleared,
+                            "line_positions": cleared_lines
+                        },
+                        "GameBoard"
+                    )
                 
                 # Publish board update event
-                self.event_bus.publish_event(
-                    EventType.BOARD_UPDATED,
-                    {"action": "lines_cleared", "count": lines_cleared},
-                    "GameBoard"
-                )
+                if self.event_bus.has_subscribers(EventType.BOARD_UPDATED):
+                    self.event_bus.publish_event(
+                        EventType.BOARD_UPDATED,
+                        {"action": "lines_cleared", "count": lines_cleared},
+                        "GameBoard"
+                    )
                 
                 self.logger.info(f"Cleared {lines_cleared} lines")
             
@@ -175,52 +267,64 @@ class GameBoard(IGameBoard, Injectable):
             return None
         
         try:
-            # Start from current position and move down until collision
-            ghost_piece = piece
+            if not self.is_valid_position(piece):
+                return piece
             
-            while True:
-                # Try to move one position down
-                test_piece = TetrominoState(
-                    shape_type=ghost_piece.shape_type,
-                    x=ghost_piece.x,
-                    y=ghost_piece.y + 1,
-                    rotation=ghost_piece.rotation,
-                    shape=ghost_piece.shape,
-                    color=ghost_piece.color
-                )
-                
-                if self.is_valid_position(test_piece):
-                    ghost_piece = test_piece
-                else:
-                    break
+            landing_y = self.ghost_drop(piece)
+            if landing_y == piece.y:
+                return piece
             
-            return ghost_piece
+            return replace(piece, y=landing_y)
             
         except Exception as e:
             self.error_handler.handle_error(e, "calculating ghost piece position")
             return piece  # Return original piece as fallback
     
+    def ghost_drop(self, piece: TetrominoState) -> int:
+        """Get the row a valid piece lands on, memoized until the board changes."""
+        if self._ghost_cache_ver != self._version:
+            self._ghost_cache = {}
+            self._ghost_cache_ver = self._version
+        
+        key = (piece.row_masks, piece.x, piece.y)
+        landing_y = self._ghost_cache.get(key)
+        if landing_y is not None:
+            return landing_y
+        
+        # Drop distance is limited by the nearest filled cell below each
+        # piece cell; col_occ keeps lower rows in lower bits
+        height = self.height
+        drop = height
+        for dx, dy in piece.cells:
+            board_y = piece.y + dy
+            below = self.col_occ[piece.x + dx] & ((1 << (height - 1 - board_y)) - 1)
+            drop = min(drop, height - below.bit_length() - board_y - 1)
+        
+        landing_y = piece.y + max(drop, 0)
+        self._ghost_cache[key] = landing_y
+        return landing_y
+    
     def is_game_over(self) -> bool:
         """Check if game over condition is met."""
-        try:
-            # Game over if any cell in the top row is occupied
-            return any(self.board[0][x] != 0 for x in range(self.width))
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, "checking game over condition")
-            return False
+        # Game over if any cell in the top row is occupied
+        return bool(self.row_bits) and self.row_bits[0] != 0
     
     def reset(self) -> None:
         """Reset board to initial state."""
         try:
-            self.board = [[0 for _ in range(self.width)] for _ in range(self.height)]
+            self.row_bits = [0] * self.height
+            self.row_color = [bytearray(self.width) for _ in range(self.height)]
+            self.col_occ = [0] * self.width
+            self._dirty_rows = range(0)
+            self._version += 1
             
             # Publish reset event
-            self.event_bus.publish_event(
-                EventType.BOARD_UPDATED,
-                {"action": "reset"},
-                "GameBoard"
-            )
+            if self.event_bus.has_subscribers(EventType.BOARD_UPDATED):
+                self.event_bus.publish_event(
+                    EventType.BOARD_UPDATED,
+                    {"action": "reset"},
+                    "GameBoard"
+                )
             
             self.logger.info("Board reset")
             
@@ -234,20 +338,8 @@ class GameBoard(IGameBoard, Injectable):
             return self.get_board()
         
         try:
-            # Create copy of current board
-            board_copy = self.get_board()
-            
-            # Add piece to the copy
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = piece.x + col_idx
-                        board_y = piece.y + row_idx
-                        
-                        if (0 <= board_y < self.height and 
-                            0 <= board_x < self.width):
-                            board_copy[board_y][board_x] = piece.color
-            
+            board_copy = [list(row) for row in self.row_color]
+            self._overlay_piece(board_copy, piece, piece.color)
             return board_copy
             
         except Exception as e:
@@ -260,32 +352,11 @@ class GameBoard(IGameBoard, Injectable):
             return self.get_board()
         
         try:
-            # Create copy of current board
-            board_copy = self.get_board()
+            board_copy = [list(row) for row in self.row_color]
             
-            # Add ghost piece first (with special ghost color)
-            ghost_color = self.config_manager.display.colors.get("ghost", 8)
-            for row_idx, row in enumerate(ghost_piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = ghost_piece.x + col_idx
-                        board_y = ghost_piece.y + row_idx
-                        
-                        if (0 <= board_y < self.height and 
-                            0 <= board_x < self.width and
-                            board_copy[board_y][board_x] == 0):  # Only if empty
-                            board_copy[board_y][board_x] = ghost_color
-            
-            # Add current piece on top
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = piece.x + col_idx
-                        board_y = piece.y + row_idx
-                        
-                        if (0 <= board_y < self.height and 
-                            0 <= board_x < self.width):
-                            board_copy[board_y][board_x] = piece.color
+            # Add ghost piece first (with special ghost color), then current piece on top
+            self._overlay_piece(board_copy, ghost_piece, self.ghost_color, only_empty=True)
+            self._overlay_piece(board_copy, piece, piece.color)
             
             return board_copy
             
@@ -293,49 +364,133 @@ class GameBoard(IGameBoard, Injectable):
             self.error_handler.handle_error(e, "generating board with ghost")
             return self.get_board()
     
-    def _is_line_complete(self, line_y: int) -> bool:
-        """Check if a specific line is complete."""
-        if line_y < 0 or line_y >= self.height:
-            return False
+    def _overlay_piece(self, board_copy: List[List[int]], piece: TetrominoState,
+                       color: int, only_empty: bool = False) -> None:
+        """Write piece cells into a board copy, visiting occupied cells only."""
+        width = self.width
+        height = self.height
+        for dx, dy in piece.cells:
+            board_x = piece.x + dx
+            board_y = piece.y + dy
+            
+            if not (0 <= board_y < height and 0 <= board_x < width):
+                continue
+            if not (only_empty and board_copy[board_y][board_x]):
+                board_copy[board_y][board_x] = color
+    
+    def _shifted_masks(self, row_masks: Tuple[int, ...], x: int) -> Optional[Tuple[int, ...]]:
+        """Get row masks shifted to column x, or None if any cell leaves the board."""
+        key = (row_masks, x)
+        try:
+            return self._shift_cache[key]
+        except KeyError:
+            pass
         
-        return all(self.board[line_y][x] != 0 for x in range(self.width))
+        # Bits pushed past column 0 or the right edge are out of bounds
+        shifted_rows = []
+        for mask in row_masks:
+            if x >= 0:
+                shifted = mask << x
+            elif mask & ((1 << -x) - 1):
+                shifted_rows = None
+                break
+            else:
+                shifted = mask >> -x
+            
+            if shifted >> self.width:
+                shifted_rows = None
+                break
+            shifted_rows.append(shifted)
+        
+        if shifted_rows is not None:
+            shifted_rows = tuple(shifted_rows)
+        self._shift_cache[key] = shifted_rows
+        return shifted_rows
     
-    def get_line_heights(self) -> List[int]:
-        """Get height of each column (for AI or statistics)."""
-        heights = []
+    def _rebuild_column_masks(self) -> None:
+        """Recompute per-column occupancy masks from row bitmasks."""
+        col_occ = [0] * self.width
         
-        for col in range(self.width):
-            height = 0
-            for row in range(self.height):
-                if self.board[row][col] != 0:
-                    height = self.height - row
-                    break
-            heights.append(height)
+        for row, bits in enumerate(self.row_bits):
+            col_bit = 1 << (self.height - 1 - row)
+            while bits:
+                low = bits & -bits
+                col_occ[low.bit_length() - 1] |= col_bit
+                bits ^= low
         
-        return heights
+        self.col_occ = col_occ
+    
+    def get_line_heights(self) -> List[int]:
+        """Get height of each column (for AI or statistics)."""
+        # Column masks keep the top row in the highest bit
+        return [col.bit_length() for col in self.col_occ]
     
     def get_holes_count(self) -> int:
         """Count holes in the board (empty cells with filled cells above)."""
         holes = 0
         
-        for col in range(self.width):
-            found_block = False
-            for row in range(self.height):
-                if self.board[row][col] != 0:
-                    found_block = True
-                elif found_block and self.board[row][col] == 0:
-                    holes += 1
+        for col in self.col_occ:
+            if col:
+                # Empty bits below the column's top block are holes
+                holes += (~col & ((1 << col.bit_length()) - 1)).bit_count()
         
         return holes
     
+    def simulate_lock(self, piece: TetrominoState) -> Tuple[List[int], int, int, int]:
+        """Simulate dropping and locking a piece without changing the board.
+        
+        Returns (row_bits_after, lines_cleared, holes, stack_height), for
+        search/AI rollouts that evaluate many candidate placements.
+        """
+        if not self.is_valid_position(piece):
+            raise ValueError("Cannot simulate piece at invalid position")
+        
+        if np is not None:
+            rows = np.array(self.row_bits, dtype=np.int64)
+            masks = np.array(piece.row_masks, dtype=np.int64)
+        else:
+            rows = list(self.row_bits)
+            masks = list(piece.row_masks)
+        
+        lines_cleared, holes, stack_height = lock_and_score(
+            rows, masks, piece.x, piece.y, self.width, self.height
+        )
+        return [int(bits) for bits in rows], lines_cleared, holes, stack_height
+    
+    def _peek_board_array(self):
+        """Get a NumPy view of the board, rebuilt only when the board changed."""
+        if self._np_board_ver != self._version:
+            flat = np.frombuffer(b"".join(self.row_color), dtype=np.uint8)
+            self._np_board = flat.reshape(self.height, self.width)
+            self._np_board_ver = self._version
+        return self._np_board
+    
     def get_board_statistics(self) -> dict:
         """Get various board statistics."""
+        if np is not None:
+            occupied = self._peek_board_array() != 0
+            filled = int(occupied.sum())
+            covered = np.logical_or.accumulate(occupied, axis=0)
+            heights = np.where(
+                occupied.any(axis=0), self.height - occupied.argmax(axis=0), 0
+            )
+            return {
+                "height": self.height,
+                "width": self.width,
+                "filled_cells": filled,
+                "empty_cells": self.width * self.height - filled,
+                "holes": int((covered & ~occupied).sum()),
+                "column_heights": heights.tolist(),
+                "top_row_filled": bool(occupied[0].any())
+            }
+        
+        filled = sum(bits.bit_count() for bits in self.row_bits)
         return {
             "height": self.height,
             "width": self.width,
-            "filled_cells": sum(1 for row in self.board for cell in row if cell != 0),
-            "empty_cells": sum(1 for row in self.board for cell in row if cell == 0),
+            "filled_cells": filled,
+            "empty_cells": self.width * self.height - filled,
             "holes": self.get_holes_count(),
             "column_heights": self.get_line_heights(),
-            "top_row_filled": any(self.board[0][x] != 0 for x in range(self.width))
+            "top_row_filled": self.row_bits[0] != 0
         }
\ No newline at end of file
@@ -1,16 +1,17 @@
 """Main game engine implementation with dependency injection."""
 
 import time
-import uuid
-from typing import Optional
+import secrets
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
 from interfaces.game_interfaces import (
     IGameEngine, IRenderer, IInputHandler, IGameBoard, 
     ITetrominoFactory, IScoreCalculator
 )
-from core.game_state import GameState, GameStatus, GameStateManager
+from core.game_state import GameState, GameStatus, GameStateManager, TetrominoState
 from core.config_manager import ConfigManager
 from core.dependency_injection import Injectable, Container
 from core.event_system import EventType, EventHandler, Event, get_event_bus
+from core.input_actions import InputAction
 from core.logger import get_logger, get_error_handler, get_game_logger
 
 
@@ -20,21 +21,38 @@ class ScoreCalculator(IScoreCalculator, Injectable):
     def __init__(self):
         self.config_manager: ConfigManager = None
         self.logger = get_logger()
+        
+        # Scoring constants cached from config at initialization
+        self._line_score_table: tuple = (0, 0, 0, 0, 0)
+        self._lines_per_level: int = 10
+        self._initial_fall_speed: int = 500
+        self._min_fall_speed: int = 50
+        self._fall_speed_increment: int = 50
     
     def initialize(self, container: Container) -> None:
         """Initialize with dependencies."""
         self.config_manager = container.get(ConfigManager)
+        
+        scoring = self.config_manager.scoring
+        self._line_score_table = (
+            0,
+            scoring.single_line,
+            scoring.double_line,
+            scoring.triple_line,
+            scoring.tetris
+        )
+        
+        game_config = self.config_manager.game
+        self._lines_per_level = game_config.lines_per_level
+        self._initial_fall_speed = game_config.initial_fall_speed
+        self._min_fall_speed = game_config.min_fall_speed
+        self._fall_speed_increment = game_config.fall_speed_increment
     
     def calculate_line_score(self, lines_cleared: int, level: int) -> int:
         """Calculate score for cleared lines."""
-        scoring = self.config_manager.scoring
-        score_table = {
-            1: scoring.single_line,
-            2: scoring.double_line,
-            3: scoring.triple_line,
-            4: scoring.tetris
-        }
-        return score_table.get(lines_cleared, 0) * level
+        if 0 < lines_cleared < len(self._line_score_table):
+            return self._line_score_table[lines_cleared] * level
+        return 0
     
     def calculate_soft_drop_score(self, lines_dropped: int) -> int:
         """Calculate score for soft drop."""
@@ -46,21 +64,21 @@ class ScoreCalculator(IScoreCalculator, Injectable):
     
     def calculate_level(self, lines_cleared: int) -> int:
         """Calculate level based on lines cleared."""
-        lines_per_level = self.config_manager.game.lines_per_level
-        return max(1, lines_cleared // lines_per_level + 1)
+        return max(1, lines_cleared // self._lines_per_level + 1)
     
     def calculate_fall_speed(self, level: int) -> int:
         """Calculate fall speed based on level."""
-        game_config = self.config_manager.game
         return max(
-            game_config.min_fall_speed,
-            game_config.initial_fall_speed - (level - 1) * game_config.fall_speed_increment
+            self._min_fall_speed,
+            self._initial_fall_speed - (level - 1) * self._fall_speed_increment
         )
 
 
 class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
     """Main Tetris game engine with dependency injection."""
     
+    _HANDLED_EVENTS = frozenset({EventType.CONFIG_CHANGED})
+    
     def __init__(self):
         # Dependencies (injected)
         self.config_manager: ConfigManager = None
@@ -80,9 +98,27 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
         # Game state
         self._running = False
         self._session_id: Optional[str] = None
-        self._last_update_time = 0
-        self._last_fall_time = 0
+        self._last_update_time: int = 0
+        self._last_fall_time: int = 0
+        # Monotonic clock in ms, sampled once per update tick
+        self._now_ms: int = 0
+        
+        # Render only when state changed or the refresh interval elapsed
+        self._last_render_epoch: int = -1
+        self._last_render_ms: int = 0
+        self._render_interval_ms: int = 16
         self._initialized = False
+        
+        # Game input dispatch: action -> (handler, extra args, log method, log tag)
+        game_logger = self.game_logger
+        self._input_table: Dict[InputAction, Tuple[Callable, tuple, Callable, str]] = {
+            InputAction.MOVE_LEFT: (self._move_piece, (-1, 0), game_logger.log_piece_moved, "left"),
+            InputAction.MOVE_RIGHT: (self._move_piece, (1, 0), game_logger.log_piece_moved, "right"),
+            InputAction.SOFT_DROP: (self._move_piece, (0, 1), game_logger.log_piece_moved, "down"),
+            InputAction.HARD_DROP: (self._hard_drop_piece, (), game_logger.log_piece_dropped, "hard"),
+            InputAction.ROTATE_RIGHT: (self._rotate_piece, ("right",), game_logger.log_piece_rotated, "right"),
+            InputAction.ROTATE_LEFT: (self._rotate_piece, ("left",), game_logger.log_piece_rotated, "left"),
+        }
     
     def initialize(self, container: Container) -> None:
         """Initialize with dependencies from container."""
@@ -111,7 +147,7 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
                 raise RuntimeError("Game engine not initialized")
             
             # Generate session ID and start logging
-            self._session_id = str(uuid.uuid4())[:8]
+            self._session_id = secrets.token_hex(4)
             self.game_logger.start_game_session(self._session_id)
             
             # Reset game state
@@ -132,7 +168,7 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
             )
             
             # Initialize timing
-            current_time = time.time() * 1000
+            current_time = self._now_ms = time.monotonic_ns() // 1_000_000
             self._last_update_time = current_time
             self._last_fall_time = current_time
             
@@ -180,7 +216,7 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
                 self.state_manager.update_state(status=GameStatus.PLAYING)
                 
                 # Reset timing to prevent time jump
-                current_time = time.time() * 1000
+                current_time = self._now_ms = time.monotonic_ns() // 1_000_000
                 self._last_update_time = current_time
                 self._last_fall_time = current_time
                 
@@ -227,72 +263,62 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
     
     def update(self, delta_time: float) -> None:
         """Update game state with elapsed time."""
-        try:
-            current_state = self.state_manager.current_state
-            
-            if current_state.status != GameStatus.PLAYING:
-                return
-            
-            current_time = time.time() * 1000
-            
-            # Handle natural falling
-            if current_time - self._last_fall_time >= current_state.fall_speed:
-                self._handle_natural_fall()
-                self._last_fall_time = current_time
-            
-            # Handle lock delay
-            if current_state.is_grounded and current_state.lock_timer > 0:
-                if current_time - current_state.lock_timer >= current_state.lock_delay:
-                    self._lock_current_piece()
-            
-            # Render current state
-            self.renderer.render_game(current_state)
-            
-            self._last_update_time = current_time
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, "updating game state")
+        current_state = self.state_manager.current_state
+        
+        if current_state.status != GameStatus.PLAYING:
+            return
+        
+        # Read the tick's timing fields once from the immutable state
+        fall_speed = current_state.fall_speed
+        is_grounded = current_state.is_grounded
+        lock_timer = current_state.lock_timer
+        lock_delay = current_state.lock_delay
+        
+        current_time = self._now_ms = time.monotonic_ns() // 1_000_000
+        
+        # Handle natural falling
+        if current_time - self._last_fall_time >= fall_speed:
+            self._handle_natural_fall(current_state)
+            self._last_fall_time = current_time
+        
+        # Handle lock delay
+        if is_grounded and lock_timer > 0:
+            if current_time - lock_timer >= lock_delay:
+                self._lock_current_piece(self.state_manager.current_state)
+        
+        # Render when something changed, or at the refresh interval
+        epoch = self.state_manager.epoch
+        if (epoch != self._last_render_epoch or
+                current_time - self._last_render_ms >= self._render_interval_ms):
+            self.renderer.render_game(self.state_manager.current_state)
+            self._last_render_epoch = epoch
+            self._last_render_ms = current_time
+        
+        self._last_update_time = current_time
     
-    def handle_input(self, input_key: str) -> None:
-        """Handle input key."""
-        try:
-            current_state = self.state_manager.current_state
-            
-            if input_key == 'quit':
-                self._running = False
-                return
-            elif input_key == 'pause':
-                if current_state.status == GameStatus.PLAYING:
-                    self.pause_game()
-                elif current_state.status == GameStatus.PAUSED:
-                    self.resume_game()
-                return
-            
-            # Only handle game inputs when playing
-            if current_state.status != GameStatus.PLAYING:
-                return
-            
-            if input_key == 'move_left':
-                self._move_piece(-1, 0)
-                self.game_logger.log_piece_moved("left")
-            elif input_key == 'move_right':
-                self._move_piece(1, 0)
-                self.game_logger.log_piece_moved("right")
-            elif input_key == 'soft_drop':
-                self._move_piece(0, 1)
-                self.game_logger.log_piece_moved("down")
-            elif input_key == 'hard_drop':
-                self._hard_drop_piece()
-                self.game_logger.log_piece_dropped("hard")
-            elif input_key == 'rotate_right':
-                self._rotate_piece("right")
-                self.game_logger.log_piece_rotated("right")
-            elif input_key == 'rotate_left':
-                self._rotate_piece("left")
-                self.game_logger.log_piece_rotated("left")
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, f"handling input {input_key}")
+    def handle_input(self, action: InputAction) -> None:
+        """Handle an input action."""
+        current_state = self.state_manager.current_state
+        
+        if action == InputAction.QUIT:
+            self._running = False
+            return
+        elif action == InputAction.PAUSE:
+            if current_state.status == GameStatus.PLAYING:
+                self.pause_game()
+            elif current_state.status == GameStatus.PAUSED:
+                self.resume_game()
+            return
+        
+        # Only handle game inputs when playing
+        if current_state.status != GameStatus.PLAYING:
+            return
+        
+        entry = self._input_table.get(action)
+        if entry:
+            handler, args, log, tag = entry
+            handler(current_state, *args)
+            log(tag)
     
     def get_current_state(self) -> GameState:
         """Get current game state."""
@@ -316,82 +342,83 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
         except Exception as e:
             self.error_handler.handle_error(e, "cleaning up game engine")
     
-    def _handle_natural_fall(self) -> None:
+    def _handle_natural_fall(self, current_state: GameState) -> None:
         """Handle natural piece falling."""
-        current_state = self.state_manager.current_state
-        
         if not current_state.current_piece:
             return
         
-        # Try to move piece down
-        moved_piece = self.tetromino_factory.move_piece(current_state.current_piece, 0, 1)
+        current_piece = current_state.current_piece
+        state_manager = self.state_manager
+        game_board = self.game_board
         
-        if self.game_board.is_valid_position(moved_piece):
+        # Try to move piece down; only build the moved piece if it fits
+        if game_board.is_valid_offset(current_piece, 0, 1):
+            moved_piece = self.tetromino_factory.move_piece(current_piece, 0, 1)
+            
             # Update piece position
-            ghost_piece = self.game_board.get_ghost_piece_position(moved_piece)
-            self.state_manager.update_state(
-                current_piece=moved_piece,
-                ghost_piece=ghost_piece,
-                is_grounded=False,
-                lock_timer=0,
-                move_resets=0
-            )
+            ghost_piece = self._ghost_after_move(current_state, moved_piece, 0)
+            state_manager.apply_move(moved_piece, ghost_piece)
         else:
             # Piece can't move down - start lock delay
             if not current_state.is_grounded:
-                self.state_manager.update_state(
-                    is_grounded=True,
-                    lock_timer=time.time() * 1000
-                )
+                state_manager.set_grounded(self._now_ms)
     
-    def _move_piece(self, dx: int, dy: int) -> bool:
+    def _move_piece(self, current_state: GameState, dx: int, dy: int) -> bool:
         """Move current piece by offset."""
-        current_state = self.state_manager.current_state
-        
         if not current_state.current_piece:
             return False
         
-        moved_piece = self.tetromino_factory.move_piece(current_state.current_piece, dx, dy)
+        game_board = self.game_board
         
-        if self.game_board.is_valid_position(moved_piece):
-            ghost_piece = self.game_board.get_ghost_piece_position(moved_piece)
+        # Rejected moves return before any piece is allocated
+        if game_board.is_valid_offset(current_state.current_piece, dx, dy):
+            moved_piece = self.tetromino_factory.move_piece(current_state.current_piece, dx, dy)
+            ghost_piece = self._ghost_after_move(current_state, moved_piece, dx)
             
             # Reset lock delay if piece moved while grounded
             new_move_resets = current_state.move_resets
-            new_is_grounded = current_state.is_grounded
             new_lock_timer = current_state.lock_timer
             
             if current_state.is_grounded:
                 new_move_resets += 1
                 if new_move_resets <= current_state.max_move_resets:
-                    new_lock_timer = time.time() * 1000  # Reset timer
+                    new_lock_timer = self._now_ms  # Reset timer
                 else:
                     # Exceeded max resets, lock immediately
-                    self._lock_current_piece()
+                    self._lock_current_piece(current_state)
                     return True
             
-            self.state_manager.update_state(
-                current_piece=moved_piece,
-                ghost_piece=ghost_piece,
-                move_resets=new_move_resets,
-                lock_timer=new_lock_timer
+            self.state_manager.set_piece(
+                moved_piece, ghost_piece, new_move_resets, new_lock_timer
             )
             
             return True
         
         return False
     
-    def _rotate_piece(self, direction: str) -> bool:
+    def _ghost_after_move(self, current_state: GameState, moved_piece: TetrominoState,
+                          dx: int) -> TetrominoState:
+        """Get the ghost for a moved piece, reusing the current one on vertical moves."""
+        # The board only changes on lock, so a piece that merely fell keeps
+        # the same landing row
+        ghost_piece = current_state.ghost_piece
+        if (dx == 0 and ghost_piece is not None and
+                ghost_piece.x == moved_piece.x and
+                ghost_piece.rotation == moved_piece.rotation and
+                ghost_piece.shape_type == moved_piece.shape_type):
+            return ghost_piece
+        return self.game_board.get_ghost_piece_position(moved_piece)
+    
+    def _rotate_piece(self, current_state: GameState, direction: str) -> bool:
         """Rotate current piece."""
-        current_state = self.state_manager.current_state
-        
         if not current_state.current_piece:
             return False
         
+        game_board = self.game_board
         rotated_piece = self.tetromino_factory.rotate_piece(current_state.current_piece, direction)
         
-        if self.game_board.is_valid_position(rotated_piece):
-            ghost_piece = self.game_board.get_ghost_piece_position(rotated_piece)
+        if game_board.is_valid_position(rotated_piece):
+            ghost_piece = game_board.get_ghost_piece_position(rotated_piece)
             
             # Reset lock delay if piece rotated while grounded
             new_move_resets = current_state.move_resets
@@ -400,99 +427,101 @@ class TetrisGameEngine(IGameEngine, Injectable, EventHandler):
             if current_state.is_grounded:
                 new_move_resets += 1
                 if new_move_resets <= current_state.max_move_resets:
-                    new_lock_timer = time.time() * 1000
+                    new_lock_timer = self._now_ms
                 else:
-                    self._lock_current_piece()
+                    self._lock_current_piece(current_state)
                     return True
             
-            self.state_manager.update_state(
-                current_piece=rotated_piece,
-                ghost_piece=ghost_piece,
-                move_resets=new_move_resets,
-                lock_timer=new_lock_timer
+            self.state_manager.set_piece(
+                rotated_piece, ghost_piece, new_move_resets, new_lock_timer
             )
             
             return True
         
         return False
     
-    def _hard_drop_piece(self) -> None:
+    def _hard_drop_piece(self, current_state: GameState) -> None:
         """Hard drop current piece."""
-        current_state = self.state_manager.current_state
-        
-        if not current_state.current_piece:
+        current_piece = current_state.current_piece
+        if not current_piece:
             return
         
         # Calculate drop distance
-        ghost_piece = self.game_board.get_ghost_piece_position(current_state.current_piece)
-        drop_distance = ghost_piece.y - current_state.current_piece.y
+        ghost_piece = self.game_board.get_ghost_piece_position(current_piece)
+        drop_distance = ghost_piece.y - current_piece.y
         
         # Calculate score for hard drop
         hard_drop_score = self.score_calculator.calculate_hard_drop_score(drop_distance)
         
-        # Update piece to ghost position and lock immediately
-        self.state_manager.update_state(current_piece=ghost_piece)
-        self.state_manager.increment_score(hard_drop_score)
-        
-        # Lock the piece
-        self._lock_current_piece()
+        # Lock at the ghost position; the drop score is credited with the lock
+        self._lock_current_piece(current_state, ghost_piece, hard_drop_score)
     
-    def _lock_current_piece(self) -> None:
-        """Lock current piece in place."""
-        current_state = self.state_manager.current_state
-        
-        if not current_state.current_piece:
+    def _lock_current_piece(self, current_state: GameState,
+                            piece: Optional[TetrominoState] = None, drop_score: int = 0) -> None:
+        """Lock current piece (or piece, its final position) in place."""
+        piece = piece or current_state.current_piece
+        if not piece:
             return
         
+        state_manager = self.state_manager
+        game_board = self.game_board
+        game_logger = self.game_logger
+        score_calculator = self.score_calculator
+        
         # Place piece on board
-        self.game_board.place_piece(current_state.current_piece)
+        game_board.place_piece(piece)
         
         # Clear completed lines
-        lines_cleared = self.game_board.clear_completed_lines()
+        lines_cleared = game_board.clear_completed_lines()
         
         # Calculate score for lines
+        line_score = 0
         if lines_cleared > 0:
-            line_score = self.score_calculator.calculate_line_score(lines_cleared, current_state.level)
-            self.state_manager.increment_score(line_score)
-            self.state_manager.clear_lines(lines_cleared)
-            self.game_logger.log_lines_cleared(lines_cleared, line_score)
-        
-        # Check for level up
-        new_level = self.score_calculator.calculate_level(current_state.lines_cleared + lines_cleared)
-        if new_level > current_state.level:
-            self.game_logger.log_level_up(new_level)
+            line_score = score_calculator.calculate_line_score(lines_cleared, current_state.level)
+            game_logger.log_lines_cleared(lines_cleared, line_score)
+            
+            # Level can only change when lines were cleared
+            new_level = score_calculator.calculate_level(current_state.lines_cleared + lines_cleared)
+            if new_level > current_state.level:
+                game_logger.log_level_up(new_level)
         
         # Spawn next piece
         next_piece = current_state.next_piece
         new_next_piece = self.tetromino_factory.create_random_piece()
         
-        # Check game over
-        if not self.game_board.is_valid_position(next_piece):
-            self.game_logger.log_game_over("board full")
+        # Check game over; the locked piece is already part of the board
+        if not game_board.is_valid_position(next_piece):
+            state_manager.apply_lock(
+                drop_score + line_score, lines_cleared,
+                current_piece=None,
+                ghost_piece=None,
+                board=game_board.get_board()
+            )
+            game_logger.log_game_over("board full")
             self.end_game()
             return
         
-        ghost_piece = self.game_board.get_ghost_piece_position(next_piece)
+        ghost_piece = game_board.get_ghost_piece_position(next_piece)
         
-        # Update state with new pieces
-        self.state_manager.update_state(
+        # Credit the lock and install the new pieces in a single state update
+        state_manager.apply_lock(
+            drop_score + line_score, lines_cleared,
             current_piece=next_piece,
             next_piece=new_next_piece,
             ghost_piece=ghost_piece,
             is_grounded=False,
             lock_timer=0,
             move_resets=0,
-            board=self.game_board.get_board()
+            board=game_board.get_board()
         )
         
-        self.game_logger.log_piece_spawned(next_piece.shape_type)
+        game_logger.log_piece_spawned(next_piece.shape_type)
     
     def handle_event(self, event: Event) -> None:
-        """Handle events."""
-        if event.event_type == EventType.CONFIG_CHANGED:
-            self.logger.info("Configuration changed, updating game settings")
-            # Could reload settings here if needed
+        """Handle events; the bus only delivers CONFIG_CHANGED here."""
+        self.logger.info("Configuration changed, updating game settings")
+        # Could reload settings here if needed
     
-    def get_handled_events(self) -> list:
-        """Return list of event types this handler processes."""
-        return [EventType.CONFIG_CHANGED]
\ No newline at end of file
+    def get_handled_events(self) -> FrozenSet[EventType]:
+        """Return the event types this handler processes."""
+        return self._HANDLED_EVENTS
@@ -1,29 +1,130 @@
 """Refactored input handler implementation with new architecture."""
 
 import curses
-from typing import Optional, Dict, List
+import functools
+from typing import Any, Optional, Dict, List
 from interfaces.game_interfaces import IInputHandler
 from core.config_manager import ConfigManager
 from core.dependency_injection import Injectable, Container
 from core.event_system import EventType, get_event_bus
-from core.logger import get_logger, get_error_handler
+from core.input_actions import InputAction
+from core.logger import LogLevel, get_logger, get_error_handler
+
+
+# Named special keys accepted in the controls configuration
+_SPECIAL_KEYS: Dict[str, int] = {
+    'KEY_LEFT': curses.KEY_LEFT,
+    'KEY_RIGHT': curses.KEY_RIGHT,
+    'KEY_UP': curses.KEY_UP,
+    'KEY_DOWN': curses.KEY_DOWN,
+    'KEY_BACKSPACE': curses.KEY_BACKSPACE,
+    'KEY_ENTER': curses.KEY_ENTER,
+    'KEY_HOME': curses.KEY_HOME,
+    'KEY_END': curses.KEY_END
+}
+
+_SPECIAL_KEY_NAMES: Dict[int, str] = {code: name for name, code in _SPECIAL_KEYS.items()}
+
+# Backslash escapes accepted in the controls configuration
+_ESCAPED_KEYS: Dict[str, int] = {
+    '\\n': ord('\n'),
+    '\\t': ord('\t'),
+    '\\r': ord('\r')
+}
+
+# Fallback controls when no configuration is available; letters map both cases
+_DEFAULT_LETTER_MAP: Dict[str, InputAction] = {
+    'q': InputAction.QUIT,
+    'p': InputAction.PAUSE,
+    'w': InputAction.ROTATE_RIGHT,
+    's': InputAction.SOFT_DROP,
+    'a': InputAction.MOVE_LEFT,
+    'd': InputAction.MOVE_RIGHT,
+    ' ': InputAction.HARD_DROP
+}
+
+_DEFAULT_SPECIAL_MAP: Dict[int, InputAction] = {
+    curses.KEY_UP: InputAction.ROTATE_RIGHT,
+    curses.KEY_DOWN: InputAction.SOFT_DROP,
+    curses.KEY_LEFT: InputAction.MOVE_LEFT,
+    curses.KEY_RIGHT: InputAction.MOVE_RIGHT
+}
+
+# Key codes below this resolve through a flat list instead of a dict probe
+_KEY_TABLE_SIZE = 1024
+
+# Request flags packed into the handler's _state_bits
+_QUIT_BIT = 1 << 0
+_PAUSE_BIT = 1 << 1
+
+# Actions that raise a request flag on the handler when pressed
+_ACTION_BITS: Dict[InputAction, int] = {
+    InputAction.QUIT: _QUIT_BIT,
+    InputAction.PAUSE: _PAUSE_BIT
+}
+
+# Order controls are read from the configuration; when a key is bound to
+# several actions the later action wins, so quit and pause take precedence
+_CONTROLS_ORDER = (
+    InputAction.MOVE_LEFT, InputAction.MOVE_RIGHT, InputAction.SOFT_DROP, InputAction.HARD_DROP,
+    InputAction.ROTATE_RIGHT, InputAction.ROTATE_LEFT, InputAction.PAUSE, InputAction.QUIT
+)
+
+_MOVEMENT_ACTIONS = frozenset({InputAction.MOVE_LEFT, InputAction.MOVE_RIGHT, InputAction.SOFT_DROP})
+_ROTATION_ACTIONS = frozenset({InputAction.ROTATE_LEFT, InputAction.ROTATE_RIGHT})
+
+
+@functools.lru_cache(maxsize=128)
+def _key_string_to_code(key: str) -> Optional[int]:
+    """Convert a configured key string to its curses key code, or None if unknown."""
+    # Handle special keys
+    key_code = _SPECIAL_KEYS.get(key)
+    if key_code is not None:
+        return key_code
+    
+    # Handle regular characters
+    if len(key) == 1:
+        return ord(key)
+    
+    # Handle escape sequences
+    return _ESCAPED_KEYS.get(key)
 
 
 class CursesInputHandler(IInputHandler, Injectable):
     """Curses-based input handler with configurable key mappings."""
     
-    def __init__(self, stdscr):
+    __slots__ = (
+        'stdscr', 'config_manager', '_skip_input_setup', 'logger', 'error_handler', 'event_bus',
+        '_initialized', '_key_mappings', '_key_table', '_getch', '_map_get', '_publish', '_has_subscribers',
+        '_readable_cache', '_state_bits', '_last_input',
+        '_current_tick_action', '_current_timeout', '_input_payloads',
+    )
+    
+    def __init__(self, stdscr, skip_input_setup: bool = False):
         self.stdscr = stdscr
+        # Leave terminal modes alone, e.g. when stdscr is a test double
+        self._skip_input_setup = skip_input_setup
         self.config_manager: ConfigManager = None
         self.logger = get_logger()
         self.error_handler = get_error_handler()
         self.event_bus = get_event_bus()
         
         self._initialized = False
-        self._key_mappings: Dict[int, str] = {}
-        self._quit_requested = False
-        self._pause_requested = False
+        self._key_mappings: Dict[int, InputAction] = {}
+        self._getch = stdscr.getch
+        # Poll-path lookups; rebuilt by _mappings_changed
+        self._key_table: List[Optional[InputAction]] = [None] * _KEY_TABLE_SIZE
+        self._map_get = self._key_mappings.get
+        self._publish = self.event_bus.publish_event
+        self._has_subscribers = self.event_bus.has_subscribers
+        self._readable_cache: Optional[Dict[str, str]] = None
+        self._state_bits = 0
         self._last_input = None
+        self._current_tick_action: Optional[InputAction] = None
+        self._current_timeout: Optional[int] = None
+        
+        # One shared INPUT_RECEIVED payload per raw key; treat as read-only
+        self._input_payloads: Dict[int, Dict[str, Any]] = {}
     
     def initialize(self, container: Container) -> None:
         """Initialize with dependencies from container."""
@@ -43,13 +144,13 @@ class CursesInputHandler(IInputHandler, Injectable):
     def _setup_input(self) -> None:
         """Set up input handling."""
         try:
-            # Skip input setup if stdscr is a mock (for testing)
-            if hasattr(self.stdscr, '_mock_name'):
-                self.logger.debug("Skipping input setup for mock object")
+            if self._skip_input_setup:
+                self.logger.debug("Skipping input setup")
                 return
             
-            self.stdscr.nodelay(True)  # Non-blocking input
-            self.stdscr.timeout(100)   # 100ms timeout
+            # getch blocks for at most the timeout instead of spinning
+            self.stdscr.timeout(100)
+            self._current_timeout = 100
             self.stdscr.keypad(True)   # Enable special keys
             
             self.logger.debug("Input handler setup completed")
@@ -69,22 +170,12 @@ class CursesInputHandler(IInputHandler, Injectable):
             self._key_mappings = {}
             
             # Map each control to its keys
-            control_mappings = {
-                'move_left': controls.move_left,
-                'move_right': controls.move_right,
-                'soft_drop': controls.soft_drop,
-                'hard_drop': controls.hard_drop,
-                'rotate_right': controls.rotate_right,
-                'rotate_left': controls.rotate_left,
-                'pause': controls.pause,
-                'quit': controls.quit
-            }
-            
-            for action, keys in control_mappings.items():
-                for key in keys:
+            for action in _CONTROLS_ORDER:
+                for key in getattr(controls, action.config_name):
                     key_code = self._convert_key_to_code(key)
                     if key_code is not None:
                         self._key_mappings[key_code] = action
+            self._mappings_changed()
             
             self.logger.debug(f"Loaded {len(self._key_mappings)} key mappings")
             
@@ -92,39 +183,23 @@ class CursesInputHandler(IInputHandler, Injectable):
             self.error_handler.handle_error(e, "loading key mappings")
             self._load_default_mappings()
     
+    def _mappings_changed(self) -> None:
+        """Rebuild the key lookups and drop caches derived from the mappings."""
+        table: List[Optional[InputAction]] = [None] * _KEY_TABLE_SIZE
+        for key_code, action in self._key_mappings.items():
+            if 0 <= key_code < _KEY_TABLE_SIZE:
+                table[key_code] = action
+        self._key_table = table
+        self._map_get = self._key_mappings.get
+        self._readable_cache = None
+    
     def _convert_key_to_code(self, key: str) -> Optional[int]:
         """Convert key string to curses key code."""
         try:
-            # Handle special keys
-            special_keys = {
-                'KEY_LEFT': curses.KEY_LEFT,
-                'KEY_RIGHT': curses.KEY_RIGHT,
-                'KEY_UP': curses.KEY_UP,
-                'KEY_DOWN': curses.KEY_DOWN,
-                'KEY_BACKSPACE': curses.KEY_BACKSPACE,
-                'KEY_ENTER': curses.KEY_ENTER,
-                'KEY_HOME': curses.KEY_HOME,
-                'KEY_END': curses.KEY_END
-            }
-            
-            if key in special_keys:
-                return special_keys[key]
-            
-            # Handle regular characters
-            if len(key) == 1:
-                return ord(key)
-            
-            # Handle escape sequences
-            if key.startswith('\\'):
-                if key == '\\n':
-                    return ord('\n')
-                elif key == '\\t':
-                    return ord('\t')
-                elif key == '\\r':
-                    return ord('\r')
-            
-            self.logger.warning(f"Unknown key format: {key}")
-            return None
+            key_code = _key_string_to_code(key)
+            if key_code is None:
+                self.logger.warning(f"Unknown key format: {key}")
+            return key_code
             
         except Exception as e:
             self.error_handler.handle_error(e, f"converting key {key}")
@@ -134,98 +209,93 @@ class CursesInputHandler(IInputHandler, Injectable):
         """Load default key mappings as fallback."""
         self.logger.warning("Using default key mappings")
         
-        self._key_mappings = {
-            ord('q'): 'quit',
-            ord('Q'): 'quit',
-            ord('p'): 'pause',
-            ord('P'): 'pause',
-            ord('w'): 'rotate_right',
-            ord('W'): 'rotate_right',
-            ord('s'): 'soft_drop',
-            ord('S'): 'soft_drop',
-            ord('a'): 'move_left',
-            ord('A'): 'move_left',
-            ord('d'): 'move_right',
-            ord('D'): 'move_right',
-            ord(' '): 'hard_drop',
-            curses.KEY_UP: 'rotate_right',
-            curses.KEY_DOWN: 'soft_drop',
-            curses.KEY_LEFT: 'move_left',
-            curses.KEY_RIGHT: 'move_right',
-        }
+        self._key_mappings = dict(_DEFAULT_SPECIAL_MAP)
+        for char, action in _DEFAULT_LETTER_MAP.items():
+            self._key_mappings[ord(char)] = action
+            if char.isalpha():
+                self._key_mappings[ord(char.upper())] = action
+        self._mappings_changed()
     
-    def get_input(self, timeout_ms: int = 100) -> Optional[str]:
-        """Get input with optional timeout."""
-        try:
-            if not self._initialized:
-                self.initialize()
-            
-            # Set timeout
+    def get_input(self, timeout_ms: int = 100) -> Optional[InputAction]:
+        """Get input with optional timeout; initialize must have run first."""
+        # Only touch the terminal when the timeout changes
+        if timeout_ms != self._current_timeout:
             self.stdscr.timeout(timeout_ms)
+            self._current_timeout = timeout_ms
+        
+        # Idle frames stop here: one getch and one compare
+        key = self._getch()
+        if key == -1:
+            return None
+        
+        # Map key to action; the dict only serves codes past the table
+        action = self._key_table[key] if 0 <= key < _KEY_TABLE_SIZE else self._map_get(key)
+        
+        if action is not None:
+            self._last_input = action
             
-            # Get key
-            key = self.stdscr.getch()
-            
-            if key == -1:  # No input
-                return None
+            # Update internal state for quick checks
+            self._state_bits |= _ACTION_BITS.get(action, 0)
             
-            # Map key to action
-            action = self._key_mappings.get(key)
+            # Publish input event only if someone listens
+            if self._has_subscribers(EventType.INPUT_RECEIVED):
+                try:
+                    self._publish(
+                        EventType.INPUT_RECEIVED,
+                        self._input_payload(key, action),
+                        "InputHandler"
+                    )
+                except Exception as e:
+                    self.error_handler.handle_error(e, "publishing input")
             
-            if action:
-                self._last_input = action
-                
-                # Update internal state for quick checks
-                if action == 'quit':
-                    self._quit_requested = True
-                elif action == 'pause':
-                    self._pause_requested = True
-                
-                # Publish input event
-                self.event_bus.publish_event(
-                    EventType.INPUT_RECEIVED,
-                    {"action": action, "raw_key": key},
-                    "InputHandler"
-                )
-                
-                self.logger.debug(f"Input received: {action}")
-                
-            return action
+            # Skip building the message when debug output is off
+            logger = self.logger
+            if logger.is_enabled_for(LogLevel.DEBUG):
+                logger.debug(f"Input received: {action.config_name}")
             
-        except Exception as e:
-            self.error_handler.handle_error(e, "getting input")
-            return None
+        return action
+    
+    def _input_payload(self, key: int, action: InputAction) -> Dict[str, Any]:
+        """Get the reusable event payload for a key, rebuilt if its action changed."""
+        payload = self._input_payloads.get(key)
+        if payload is None or payload["action"] is not action:
+            payload = self._input_payloads[key] = {"action": action, "raw_key": key}
+        return payload
+    
+    def poll_once(self, timeout_ms: int = 100) -> Optional[InputAction]:
+        """Read at most one key for this frame and cache its action."""
+        self._current_tick_action = self.get_input(timeout_ms)
+        return self._current_tick_action
     
     def is_quit_requested(self) -> bool:
         """Check if quit was requested."""
-        return self._quit_requested
+        return bool(self._state_bits & _QUIT_BIT)
     
     def is_pause_requested(self) -> bool:
         """Check if pause was requested."""
-        return self._pause_requested
+        return bool(self._state_bits & _PAUSE_BIT)
     
-    def get_movement_input(self) -> Optional[str]:
-        """Get movement input (left, right, down)."""
-        action = self.get_input()
+    def get_movement_input(self) -> Optional[InputAction]:
+        """Get movement input (left, right, down) from this frame's poll."""
+        action = self._current_tick_action
         
-        if action in ['move_left', 'move_right', 'soft_drop']:
+        if action in _MOVEMENT_ACTIONS:
             return action
         
         return None
     
-    def get_rotation_input(self) -> Optional[str]:
-        """Get rotation input (rotate_left, rotate_right)."""
-        action = self.get_input()
+    def get_rotation_input(self) -> Optional[InputAction]:
+        """Get rotation input (rotate_left, rotate_right) from this frame's poll."""
+        action = self._current_tick_action
         
-        if action in ['rotate_left', 'rotate_right']:
+        if action in _ROTATION_ACTIONS:
             return action
         
         return None
     
     def is_hard_drop_requested(self) -> bool:
-        """Check if hard drop was requested."""
-        action = self.get_input()
-        return action == 'hard_drop'
+        """Check if hard drop was requested in this frame's poll."""
+        return self._current_tick_action == InputAction.HARD_DROP
     
     def cleanup(self) -> None:
         """Clean up input handling resources."""
@@ -233,6 +303,7 @@ class CursesInputHandler(IInputHandler, Injectable):
             if self._initialized:
                 self.stdscr.nodelay(False)
                 self.stdscr.timeout(-1)
+                self._current_timeout = -1
                 self._initialized = False
                 self.logger.info("Input handler cleaned up")
         except Exception as e:
@@ -240,12 +311,12 @@ class CursesInputHandler(IInputHandler, Injectable):
     
     def reset_state(self) -> None:
         """Reset input state flags."""
-        self._quit_requested = False
-        self._pause_requested = False
+        self._state_bits = 0
         self._last_input = None
+        self._current_tick_action = None
         self.logger.debug("Input state reset")
     
-    def get_last_input(self) -> Optional[str]:
+    def get_last_input(self) -> Optional[InputAction]:
         """Get the last input action."""
         return self._last_input
     
@@ -254,7 +325,8 @@ class CursesInputHandler(IInputHandler, Injectable):
         try:
             key_code = self._convert_key_to_code(key)
             if key_code is not None:
-                self._key_mappings[key_code] = action
+                self._key_mappings[key_code] = InputAction.from_config_name(action)
+                self._mappings_changed()
                 self.logger.debug(f"Added key mapping: {key} -> {action}")
             else:
                 self.error_handler.handle_validation_error("key", key, "valid key format")
@@ -268,6 +340,7 @@ class CursesInputHandler(IInputHandler, Injectable):
             key_code = self._convert_key_to_code(key)
             if key_code is not None and key_code in self._key_mappings:
                 del self._key_mappings[key_code]
+                self._mappings_changed()
                 self.logger.debug(f"Removed key mapping: {key}")
                 
         except Exception as e:
@@ -276,6 +349,9 @@ class CursesInputHandler(IInputHandler, Injectable):
     def get_all_mappings(self) -> Dict[str, str]:
         """Get all current key mappings."""
         try:
+            if self._readable_cache is not None:
+                return dict(self._readable_cache)
+            
             # Convert key codes back to readable format
             readable_mappings = {}
             
@@ -285,19 +361,12 @@ class CursesInputHandler(IInputHandler, Injectable):
                     key_str = chr(key_code)
                 else:
                     # Special keys
-                    special_key_map = {
-                        curses.KEY_LEFT: 'KEY_LEFT',
-                        curses.KEY_RIGHT: 'KEY_RIGHT',
-                        curses.KEY_UP: 'KEY_UP',
-                        curses.KEY_DOWN: 'KEY_DOWN',
-                        curses.KEY_BACKSPACE: 'KEY_BACKSPACE',
-                        curses.KEY_ENTER: 'KEY_ENTER'
-                    }
-                    key_str = special_key_map.get(key_code, f'KEY_{key_code}')
+                    key_str = _SPECIAL_KEY_NAMES.get(key_code, f'KEY_{key_code}')
                 
-                readable_mappings[key_str] = action
+                readable_mappings[key_str] = action.config_name
             
-            return readable_mappings
+            self._readable_cache = readable_mappings
+            return dict(readable_mappings)
             
         except Exception as e:
             self.error_handler.handle_error(e, "getting all mappings")
@@ -309,26 +378,19 @@ class CursesInputHandler(IInputHandler, Injectable):
         
         try:
             required_actions = {
-                'move_left', 'move_right', 'soft_drop', 'hard_drop',
-                'rotate_right', 'pause', 'quit'
+                InputAction.MOVE_LEFT, InputAction.MOVE_RIGHT, InputAction.SOFT_DROP,
+                InputAction.HARD_DROP, InputAction.ROTATE_RIGHT, InputAction.PAUSE,
+                InputAction.QUIT
             }
             
             mapped_actions = set(self._key_mappings.values())
             
             # Check for missing actions
             missing_actions = required_actions - mapped_actions
-            for action in missing_actions:
-                issues.append(f"Missing key mapping for action: {action}")
-            
-            # Check for duplicate keys (not technically an issue, but worth noting)
-            key_counts = {}
-            for key_code in self._key_mappings.keys():
-                key_counts[key_code] = key_counts.get(key_code, 0) + 1
-            
-            for key_code, count in key_counts.items():
-                if count > 1:
-                    issues.append(f"Key {key_code} mapped to multiple actions")
+            for action in sorted(missing_actions):
+                issues.append(f"Missing key mapping for action: {action.config_name}")
             
+            # A key code is a dict key, so it can never map to two actions
             return issues
             
         except Exception as e:
@@ -1,15 +1,21 @@
 """Refactored renderer implementation with new architecture."""
 
 import curses
-from typing import List, Optional
+from itertools import groupby
+from typing import Dict, List, Optional, Tuple
 from interfaces.game_interfaces import IRenderer
-from core.game_state import GameState, TetrominoState
-from core.config_manager import ConfigManager
+from core.game_state import GameState, TetrominoState, compute_preview
+from core.config_manager import ConfigManager, DisplayConfig
 from core.dependency_injection import Injectable, Container
 from core.event_system import EventType, EventHandler, Event, get_event_bus
 from core.logger import get_logger, get_error_handler
 
 
+# One screen cell in the frame buffers: (character, curses attribute)
+Cell = Tuple[str, int]
+_BLANK: Cell = (' ', 0)
+
+
 class CursesRenderer(IRenderer, Injectable, EventHandler):
     """Curses-based renderer implementation with dependency injection."""
     
@@ -23,11 +29,38 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
         self._initialized = False
         self._color_pairs_initialized = False
         self._display_config = None
+        
+        # Display settings read per frame, cached as plain ints
+        self._board_x = 2
+        self._board_y = 2
+        self._info_x = 25
+        self._border_color = 9
+        self._ghost_color = 8
+        self._cell_attrs: Dict[int, int] = {}
+        self._previews: Dict[Tuple[str, int], Tuple[Tuple[int, ...], ...]] = {}
+        
+        # Reused buffers for drawing pieces over the board each frame
+        self._board_view: List[List[int]] = []
+        self._board_scratch: List[List[int]] = []
+        
+        # Frames are drawn into _cur_cells and only the cells that differ
+        # from _prev_cells (what the terminal shows) are written out
+        self._frame_size = (0, 0)
+        self._cur_cells: List[List[Cell]] = []
+        self._prev_cells: List[List[Cell]] = []
+        self._blank_row: List[Cell] = []
+        
+        # Everything a frame depends on; an equal key means an identical frame
+        self._last_frame_key: Optional[tuple] = None
+        
+        # Border, labels and help drawn once per terminal size and board size
+        self._static_cells: Optional[List[List[Cell]]] = None
+        self._static_board_size = (0, 0)
     
     def initialize(self, container: Container) -> None:
         """Initialize with dependencies from container."""
         self.config_manager = container.get(ConfigManager)
-        self._display_config = self.config_manager.display
+        self._apply_display_config(self.config_manager.display)
         
         # Subscribe to events
         self.event_bus.subscribe_multiple(self)
@@ -37,6 +70,15 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
         
         self.logger.info("CursesRenderer initialized")
     
+    def _apply_display_config(self, display: DisplayConfig) -> None:
+        """Store the display configuration and cache the values frames use."""
+        self._display_config = display
+        self._board_x = display.board_offset_x
+        self._board_y = display.board_offset_y
+        self._info_x = display.info_offset_x
+        self._border_color = display.colors.get("board", 9)
+        self._ghost_color = display.colors.get("ghost", 8)
+    
     def initialize_renderer(self) -> None:
         """Initialize the renderer without dependencies."""
         if not self._initialized:
@@ -46,16 +88,12 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
     def _setup_curses(self) -> None:
         """Set up curses environment."""
         try:
-            # Skip curses setup if stdscr is a mock (for testing)
-            if hasattr(self.stdscr, '_mock_name'):
-                self.logger.debug("Skipping curses setup for mock object")
-                return
-            
             # Basic curses setup
             curses.curs_set(0)  # Hide cursor
             curses.noecho()
             curses.cbreak()
             self.stdscr.keypad(True)
+            self.stdscr.leaveok(True)  # Cursor is hidden; skip repositioning it
             
             # Initialize colors if supported
             if curses.has_colors():
@@ -105,6 +143,7 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
                     curses.init_pair(color_id, curses_color, curses.COLOR_BLACK)
             
             self._color_pairs_initialized = True
+            self._fill_cell_attrs()
             self.logger.debug("Color pairs initialized")
             
         except Exception as e:
@@ -125,6 +164,7 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
             curses.init_pair(8, curses.COLOR_WHITE, curses.COLOR_BLACK)
             curses.init_pair(9, curses.COLOR_WHITE, curses.COLOR_BLACK)
             self._color_pairs_initialized = True
+            self._fill_cell_attrs()
         except Exception as e:
             self.error_handler.handle_error(e, "initializing default colors")
     
@@ -132,9 +172,19 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
         """Render the complete game state."""
         try:
             if not self._initialized:
-                self.initialize()
+                self.initialize_renderer()
+            
+            # Repeated requests for an unchanged state draw nothing new
+            frame_key = (
+                self.stdscr.getmaxyx(), state.status, state.score, state.level, state.lines_cleared,
+                state.current_piece, state.ghost_piece, state.next_piece, state.board
+            )
+            if frame_key == self._last_frame_key:
+                return
+            self._last_frame_key = frame_key
             
-            self.clear_screen()
+            board = state.board
+            self._begin_frame((len(board[0]), len(board)) if board else None)
             
             # Render based on game status
             if state.status.value == "playing":
@@ -149,6 +199,8 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
             self.refresh()
             
         except Exception as e:
+            # Draw helpers do not catch errors themselves; this is the one handler
+            self._last_frame_key = None
             self.error_handler.handle_error(e, "rendering game state")
     
     def _render_playing_state(self, state: GameState) -> None:
@@ -169,71 +221,57 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
         if state.next_piece:
             self.render_next_piece(state.next_piece)
         
-        # Render game info
+        # Render game info; labels and controls come from the static layer
         self.render_game_info(state.score, state.level, state.lines_cleared)
-        
-        # Render controls
-        self.render_controls_help()
     
     def render_board(self, board: List[List[int]], ghost_piece: Optional[TetrominoState] = None) -> None:
-        """Render the game board with optional ghost piece."""
-        try:
-            if not board:
-                return
-            
-            height = len(board)
-            width = len(board[0]) if board else 0
-            
-            offset_x = self._display_config.board_offset_x if self._display_config else 2
-            offset_y = self._display_config.board_offset_y if self._display_config else 2
-            
-            # Draw border
-            self._draw_board_border(width, height, offset_x, offset_y)
-            
-            # Draw board content
-            for y in range(height):
-                for x in range(width):
-                    screen_x = offset_x + x * 2 + 1
-                    screen_y = offset_y + y + 1
-                    
-                    cell_value = board[y][x]
-                    self._draw_board_cell(screen_x, screen_y, cell_value)
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, "rendering board")
+        """Render the board cells; the border is part of the static layer."""
+        if not board:
+            return
+        
+        put = self._put
+        cell_attr = self._cell_attr
+        left = self._board_x + 1
+        top = self._board_y + 1
+        
+        # Draw each row as runs of equal cells
+        for y, row in enumerate(board, top):
+            screen_x = left
+            for cell_value, run in groupby(row):
+                count = len(list(run))
+                put(y, screen_x, ('. ' if cell_value == 0 else '[]') * count, cell_attr(cell_value))
+                screen_x += 2 * count
     
     def _draw_board_border(self, width: int, height: int, offset_x: int, offset_y: int) -> None:
         """Draw board border."""
-        try:
-            border_color = self._display_config.colors.get("board", 9) if self._display_config else 9
-            
-            # Vertical borders
-            for y in range(height + 2):
-                self.stdscr.addstr(offset_y + y, offset_x, '|', curses.color_pair(border_color))
-                self.stdscr.addstr(offset_y + y, offset_x + width * 2 + 1, '|', curses.color_pair(border_color))
-            
-            # Horizontal border (bottom)
-            for x in range(width * 2 + 2):
-                self.stdscr.addstr(offset_y + height + 1, offset_x + x, '-', curses.color_pair(border_color))
-                
-        except Exception as e:
-            self.error_handler.handle_error(e, "drawing board border")
+        attr = curses.color_pair(self._border_color)
+        
+        # Vertical borders
+        for y in range(height + 2):
+            self._put(offset_y + y, offset_x, '|', attr)
+            self._put(offset_y + y, offset_x + width * 2 + 1, '|', attr)
+        
+        # Horizontal border (bottom)
+        self._put(offset_y + height + 1, offset_x, '-' * (width * 2 + 2), attr)
     
-    def _draw_board_cell(self, x: int, y: int, cell_value: int) -> None:
-        """Draw a single board cell."""
-        try:
+    def _fill_cell_attrs(self) -> None:
+        """Precompute cell attributes for every configured color pair."""
+        self._cell_attrs.clear()
+        for cell_value in range(10):
+            self._cell_attr(cell_value)
+    
+    def _cell_attr(self, cell_value: int) -> int:
+        """Return the curses attribute for a board cell value."""
+        attr = self._cell_attrs.get(cell_value)
+        if attr is None:
             if cell_value == 0:
-                # Empty cell
-                self.stdscr.addstr(y, x, '. ')
-            elif cell_value == self._display_config.colors.get("ghost", 8) if self._display_config else 8:
-                # Ghost piece
-                self.stdscr.addstr(y, x, '[]', curses.color_pair(cell_value) | curses.A_DIM)
+                attr = 0
+            elif cell_value == self._ghost_color:
+                attr = curses.color_pair(cell_value) | curses.A_DIM
             else:
-                # Regular piece
-                self.stdscr.addstr(y, x, '[]', curses.color_pair(cell_value))
-                
-        except Exception as e:
-            self.error_handler.handle_error(e, f"drawing cell at ({x}, {y})")
+                attr = curses.color_pair(cell_value)
+            self._cell_attrs[cell_value] = attr
+        return attr
     
     def render_piece(self, piece: TetrominoState) -> None:
         """Render a tetromino piece."""
@@ -243,111 +281,175 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
     
     def render_next_piece(self, piece: TetrominoState) -> None:
         """Render the next piece preview."""
-        try:
-            info_offset_x = self._display_config.info_offset_x if self._display_config else 25
-            
-            self.stdscr.addstr(2, info_offset_x, "Next:")
-            
-            if piece and piece.shape:
-                # Get compact preview of the piece
-                preview = self._get_piece_preview(piece)
-                
-                for row_idx, row in enumerate(preview):
-                    for col_idx, cell in enumerate(row):
-                        if cell:
-                            screen_x = info_offset_x + col_idx * 2
-                            screen_y = 3 + row_idx
-                            self.stdscr.addstr(screen_y, screen_x, '[]', curses.color_pair(piece.color))
+        info_offset_x = self._info_x
+        
+        if piece and piece.shape:
+            # Shapes never change once loaded, so crop each rotation once
+            key = (piece.shape_type, piece.rotation)
+            preview = self._previews.get(key)
+            if preview is None:
+                preview = self._previews[key] = compute_preview(piece.shape)
             
-        except Exception as e:
-            self.error_handler.handle_error(e, "rendering next piece")
+            attr = curses.color_pair(piece.color)
+            for row_idx, row in enumerate(preview):
+                for col_idx, cell in enumerate(row):
+                    if cell:
+                        screen_x = info_offset_x + col_idx * 2
+                        screen_y = 3 + row_idx
+                        self._put(screen_y, screen_x, '[]', attr)
     
     def render_game_info(self, score: int, level: int, lines: int) -> None:
-        """Render game information (score, level, lines)."""
-        try:
-            info_offset_x = self._display_config.info_offset_x if self._display_config else 25
-            
-            self.stdscr.addstr(8, info_offset_x, f"Score: {score}")
-            self.stdscr.addstr(9, info_offset_x, f"Level: {level}")
-            self.stdscr.addstr(10, info_offset_x, f"Lines: {lines}")
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, "rendering game info")
+        """Render game information values next to their static labels."""
+        value_x = self._info_x + 7
+        
+        self._put(8, value_x, str(score))
+        self._put(9, value_x, str(level))
+        self._put(10, value_x, str(lines))
     
     def render_controls_help(self) -> None:
         """Render controls help information."""
-        try:
-            info_offset_x = self._display_config.info_offset_x if self._display_config else 25
-            
-            controls = [
-                "Controls:",
-                "W/↑: Rotate",
-                "A/←: Left",
-                "D/→: Right",
-                "S/↓: Soft Drop",
-                "Space: Hard Drop",
-                "P: Pause",
-                "Q: Quit"
-            ]
-            
-            for i, control in enumerate(controls):
-                self.stdscr.addstr(12 + i, info_offset_x, control)
-                
-        except Exception as e:
-            self.error_handler.handle_error(e, "rendering controls help")
+        info_offset_x = self._info_x
+        
+        controls = [
+            "Controls:",
+            "W/↑: Rotate",
+            "A/←: Left",
+            "D/→: Right",
+            "S/↓: Soft Drop",
+            "Space: Hard Drop",
+            "P: Pause",
+            "Q: Quit"
+        ]
+        
+        for i, control in enumerate(controls):
+            self._put(12 + i, info_offset_x, control)
     
     def render_pause_screen(self) -> None:
         """Render pause screen."""
-        try:
-            height, width = self.stdscr.getmaxyx()
-            message = "PAUSED - Press P to continue"
-            x = (width - len(message)) // 2
-            y = height // 2
-            
-            self.stdscr.addstr(y, x, message, curses.A_BOLD | curses.A_REVERSE)
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, "rendering pause screen")
+        height, width = self._frame_size
+        message = "PAUSED - Press P to continue"
+        x = (width - len(message)) // 2
+        y = height // 2
+        
+        self._put(y, x, message, curses.A_BOLD | curses.A_REVERSE)
     
     def render_game_over_screen(self, final_score: int, final_level: int) -> None:
         """Render game over screen."""
-        try:
-            height, width = self.stdscr.getmaxyx()
-            
-            messages = [
-                "GAME OVER",
-                f"Final Score: {final_score}",
-                f"Final Level: {final_level}",
-                "Press Q to quit"
-            ]
-            
-            start_y = height // 2 - len(messages) // 2
+        height, width = self._frame_size
+        
+        messages = [
+            "GAME OVER",
+            f"Final Score: {final_score}",
+            f"Final Level: {final_level}",
+            "Press Q to quit"
+        ]
+        
+        start_y = height // 2 - len(messages) // 2
+        
+        for i, message in enumerate(messages):
+            x = (width - len(message)) // 2
+            y = start_y + i
             
-            for i, message in enumerate(messages):
-                x = (width - len(message)) // 2
-                y = start_y + i
-                
-                if i == 0:  # "GAME OVER" with special formatting
-                    self.stdscr.addstr(y, x, message, curses.A_BOLD | curses.A_BLINK)
-                else:
-                    self.stdscr.addstr(y, x, message, curses.A_BOLD)
-                    
-        except Exception as e:
-            self.error_handler.handle_error(e, "rendering game over screen")
+            if i == 0:  # "GAME OVER" with special formatting
+                self._put(y, x, message, curses.A_BOLD | curses.A_REVERSE)
+            else:
+                self._put(y, x, message, curses.A_BOLD)
     
     def clear_screen(self) -> None:
-        """Clear the screen."""
+        """Start a new frame with an empty back buffer."""
+        self._last_frame_key = None
+        self._begin_frame(None)
+    
+    def _begin_frame(self, board_size: Optional[Tuple[int, int]]) -> None:
+        """Reset the back buffer to blank, or to the static layer for a board of board_size."""
+        size = self.stdscr.getmaxyx()
+        if size != self._frame_size:
+            self._allocate_frames(*size)
+        
+        if board_size is None:
+            for row in self._cur_cells:
+                row[:] = self._blank_row
+            return
+        
+        if self._static_cells is None or board_size != self._static_board_size:
+            self._render_static_chrome(*board_size)
+        for row, static_row in zip(self._cur_cells, self._static_cells):
+            row[:] = static_row
+    
+    def _render_static_chrome(self, width: int, height: int) -> None:
+        """Draw the border, panel labels and controls help into the static layer."""
+        frame = self._cur_cells
+        self._cur_cells = [self._blank_row[:] for _ in range(self._frame_size[0])]
         try:
-            self.stdscr.clear()
-        except Exception as e:
-            self.error_handler.handle_error(e, "clearing screen")
+            info_offset_x = self._info_x
+            
+            self._draw_board_border(width, height, self._board_x, self._board_y)
+            self._put(2, info_offset_x, "Next:")
+            self._put(8, info_offset_x, "Score:")
+            self._put(9, info_offset_x, "Level:")
+            self._put(10, info_offset_x, "Lines:")
+            self.render_controls_help()
+            
+            self._static_cells = self._cur_cells
+            self._static_board_size = (width, height)
+        finally:
+            self._cur_cells = frame
     
     def refresh(self) -> None:
-        """Refresh the display."""
-        try:
-            self.stdscr.refresh()
-        except Exception as e:
-            self.error_handler.handle_error(e, "refreshing display")
+        """Write the cells that changed since the last frame and refresh the display."""
+        self._flush()
+        # One physical terminal update per frame
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+    
+    def _allocate_frames(self, height: int, width: int) -> None:
+        """Size both frame buffers to the terminal and repaint from blank."""
+        self._frame_size = (height, width)
+        self._blank_row = [_BLANK] * width
+        self._cur_cells = [self._blank_row[:] for _ in range(height)]
+        self._prev_cells = [self._blank_row[:] for _ in range(height)]
+        self._static_cells = None
+        # The previous frame is now all blank, so the terminal must match
+        self.stdscr.erase()
+    
+    def _put(self, y: int, x: int, text: str, attr: int = 0) -> None:
+        """Draw text into the current frame, clipped to the screen."""
+        if not 0 <= y < self._frame_size[0]:
+            return
+        row = self._cur_cells[y]
+        width = self._frame_size[1]
+        for col, char in enumerate(text, x):
+            if 0 <= col < width:
+                row[col] = (char, attr)
+    
+    def _flush(self) -> None:
+        """Emit the cells of the current frame that differ from the previous one."""
+        addstr = self.stdscr.addstr
+        for y, (row, prev_row) in enumerate(zip(self._cur_cells, self._prev_cells)):
+            if row == prev_row:
+                continue
+            
+            # Write each run sharing an attribute in one call, from its first
+            # to its last changed cell; unchanged cells inside are rewritten
+            x = 0
+            width = len(row)
+            while x < width:
+                if row[x] == prev_row[x]:
+                    x += 1
+                    continue
+                start = x
+                attr = row[x][1]
+                x += 1
+                end = x
+                while x < width and row[x][1] == attr:
+                    if row[x] != prev_row[x]:
+                        end = x + 1
+                    x += 1
+                try:
+                    addstr(y, start, ''.join(cell[0] for cell in row[start:end]), attr)
+                except curses.error:
+                    pass  # Writing the bottom-right cell moves the cursor off screen
+        self._cur_cells, self._prev_cells = self._prev_cells, self._cur_cells
     
     def cleanup(self) -> None:
         """Clean up rendering resources."""
@@ -367,7 +469,9 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
                 self.render_game(state)
         elif event.event_type == EventType.CONFIG_CHANGED:
             # Reload display configuration
-            self._display_config = self.config_manager.display
+            self._apply_display_config(self.config_manager.display)
+            self._static_cells = None
+            self._last_frame_key = None
             self._color_pairs_initialized = False
             self._initialize_color_pairs()
     
@@ -377,81 +481,52 @@ class CursesRenderer(IRenderer, Injectable, EventHandler):
     
     def _get_board_with_piece(self, board: List[List[int]], piece: TetrominoState) -> List[List[int]]:
         """Get board with piece overlay."""
-        board_copy = [row[:] for row in board]
-        
-        if piece and piece.shape:
-            for row_idx, row in enumerate(piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = piece.x + col_idx
-                        board_y = piece.y + row_idx
-                        
-                        if (0 <= board_y < len(board_copy) and 
-                            0 <= board_x < len(board_copy[0])):
-                            board_copy[board_y][board_x] = piece.color
-        
-        return board_copy
+        return self._overlay_pieces(board, ((piece, piece.color, False),))
     
     def _get_board_with_all_pieces(self, board: List[List[int]], 
                                   current_piece: TetrominoState, 
                                   ghost_piece: TetrominoState) -> List[List[int]]:
         """Get board with both current and ghost pieces."""
-        board_copy = [row[:] for row in board]
-        
-        # Add ghost piece first (lower priority)
-        if ghost_piece and ghost_piece.shape:
-            ghost_color = self._display_config.colors.get("ghost", 8) if self._display_config else 8
-            for row_idx, row in enumerate(ghost_piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = ghost_piece.x + col_idx
-                        board_y = ghost_piece.y + row_idx
-                        
-                        if (0 <= board_y < len(board_copy) and 
-                            0 <= board_x < len(board_copy[0]) and
-                            board_copy[board_y][board_x] == 0):  # Only if empty
-                            board_copy[board_y][board_x] = ghost_color
-        
-        # Add current piece on top (higher priority)
-        if current_piece and current_piece.shape:
-            for row_idx, row in enumerate(current_piece.shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        board_x = current_piece.x + col_idx
-                        board_y = current_piece.y + row_idx
-                        
-                        if (0 <= board_y < len(board_copy) and 
-                            0 <= board_x < len(board_copy[0])):
-                            board_copy[board_y][board_x] = current_piece.color
+        # A ghost under a resting piece is fully covered by it
+        if ghost_piece is None or (
+            ghost_piece.y == current_piece.y and ghost_piece.x == current_piece.x
+            and ghost_piece.cells is current_piece.cells
+        ):
+            return self._get_board_with_piece(board, current_piece)
         
-        return board_copy
+        # Ghost first (only on empty cells), current piece on top
+        return self._overlay_pieces(board, (
+            (ghost_piece, self._ghost_color, True),
+            (current_piece, current_piece.color, False),
+        ))
     
-    def _get_piece_preview(self, piece: TetrominoState) -> List[List[int]]:
-        """Get compact preview of piece for display."""
-        if not piece or not piece.shape:
-            return [[0]]
+    def _overlay_pieces(self, board: List[List[int]], overlays) -> List[List[int]]:
+        """Draw (piece, color, empty_only) overlays onto a view of board.
         
-        # Find bounding box of the piece
-        min_row, max_row = len(piece.shape), -1
-        min_col, max_col = len(piece.shape[0]) if piece.shape else 0, -1
+        The view and the rows a piece touches are reused scratch lists, valid
+        until the next overlay; untouched rows are shared with board.
+        """
+        board_copy = self._board_view
+        board_copy[:] = board
+        scratch = self._board_scratch
+        height = len(board)
+        width = len(board[0]) if board else 0
+        if len(scratch) < height:
+            scratch.extend([] for _ in range(height - len(scratch)))
         
-        for row_idx, row in enumerate(piece.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    min_row = min(min_row, row_idx)
-                    max_row = max(max_row, row_idx)
-                    min_col = min(min_col, col_idx)
-                    max_col = max(max_col, col_idx)
+        for piece, color, empty_only in overlays:
+            if not piece:
+                continue
+            for dx, dy in piece.cells:
+                board_x = piece.x + dx
+                board_y = piece.y + dy
+                if 0 <= board_y < height and 0 <= board_x < width:
+                    row = board_copy[board_y]
+                    if row is board[board_y]:
+                        row = scratch[board_y]
+                        row[:] = board[board_y]
+                        board_copy[board_y] = row
+                    if not empty_only or row[board_x] == 0:
+                        row[board_x] = color
         
-        if max_row == -1:  # Empty piece
-            return [[0]]
-        
-        # Extract minimal bounding box
-        preview = []
-        for row_idx in range(min_row, max_row + 1):
-            preview_row = []
-            for col_idx in range(min_col, max_col + 1):
-                preview_row.append(piece.shape[row_idx][col_idx])
-            preview.append(preview_row)
-        
-        return preview
\ No newline at end of file
+        return board_copy
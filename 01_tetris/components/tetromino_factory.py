@@ -1,23 +1,63 @@
 """Configuration-based tetromino factory implementation."""
 
 import random
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from interfaces.game_interfaces import ITetrominoFactory
-from core.game_state import TetrominoState
+from core.game_state import (
+    TetrominoState, compute_row_masks, compute_cells, compute_extents, compute_preview
+)
 from core.config_manager import ConfigManager
 from core.dependency_injection import Injectable, Container
-from core.logger import get_logger, get_error_handler
+from core.logger import LogLevel, get_logger, get_error_handler
+
+
+# Shape data for one rotation: (shape, row_masks, cells, extents)
+RotationEntry = Tuple[List[List[int]], Tuple[int, ...], Tuple[Tuple[int, int], ...], Tuple[int, int, int]]
+
+_ROTATION_STEPS: Dict[str, int] = {"right": 1, "left": -1}
+
+_CELL_VALUES = frozenset({0, 1})
+
+
+def _is_valid_piece_config(config: Any) -> bool:
+    """Check a piece config has 4x4 0/1 shapes and a color in 1-9."""
+    try:
+        shapes = config["shapes"]
+        color = config["color"]
+    except (KeyError, TypeError):
+        return False
+    
+    if not shapes or not isinstance(shapes, list):
+        return False
+    
+    for shape in shapes:
+        if not isinstance(shape, list) or len(shape) != 4:
+            return False
+        for row in shape:
+            if (not isinstance(row, list) or len(row) != 4
+                    or not all(isinstance(cell, int) for cell in row)
+                    or not _CELL_VALUES.issuperset(row)):
+                return False
+    
+    return isinstance(color, int) and 1 <= color <= 9
 
 
 class TetrominoFactory(ITetrominoFactory, Injectable):
     """Factory for creating tetromino pieces from configuration."""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.config_manager: ConfigManager = None
         self.logger = get_logger()
         self.error_handler = get_error_handler()
         self._piece_types: List[str] = []
         self._shapes_cache: Dict[str, Dict[str, Any]] = {}
+        self._rotations: Dict[str, Tuple[RotationEntry, ...]] = {}
+        self._previews: Dict[Tuple[str, int], Tuple[Tuple[int, ...], ...]] = {}
+        self._valid_types: Dict[str, bool] = {}
+        
+        # 7-bag randomizer: every type is dealt once per shuffled bag
+        self._rng = random.Random(seed)
+        self._bag: List[str] = []
     
     def initialize(self, container: Container) -> None:
         """Initialize with dependencies from container."""
@@ -41,6 +81,28 @@ class TetrominoFactory(ITetrominoFactory, Injectable):
             self.error_handler.handle_error(e, "loading tetromino configurations", critical=True)
             # Fallback to hardcoded basic pieces
             self._load_fallback_pieces()
+        
+        self._build_shape_tables()
+    
+    def _build_shape_tables(self) -> None:
+        """Precompute shape, row bitmasks, cell offsets and extents for every rotation of each type."""
+        self._bag = []
+        self._valid_types = {
+            piece_type: _is_valid_piece_config(config)
+            for piece_type, config in self._shapes_cache.items()
+        }
+        self._rotations = {
+            piece_type: tuple(
+                (shape, compute_row_masks(shape), compute_cells(shape), compute_extents(shape))
+                for shape in config.get("shapes", [])
+            )
+            for piece_type, config in self._shapes_cache.items()
+        }
+        self._previews = {
+            (piece_type, rotation): compute_preview(entry[0])
+            for piece_type, rotations in self._rotations.items()
+            for rotation, entry in enumerate(rotations)
+        }
     
     def _load_fallback_pieces(self) -> None:
         """Load fallback pieces if configuration fails."""
@@ -75,39 +137,43 @@ class TetrominoFactory(ITetrominoFactory, Injectable):
         self._shapes_cache = fallback_pieces
     
     def create_random_piece(self) -> TetrominoState:
-        """Create a random tetromino piece."""
-        if not self._piece_types:
-            raise RuntimeError("No tetromino types available")
+        """Create the next piece from the current bag, refilling it when empty."""
+        if not self._bag:
+            if not self._piece_types:
+                raise RuntimeError("No tetromino types available")
+            self._bag = self._rng.sample(self._piece_types, len(self._piece_types))
         
-        piece_type = random.choice(self._piece_types)
-        return self.create_piece(piece_type)
+        return self.create_piece(self._bag.pop())
     
     def create_piece(self, piece_type: str) -> TetrominoState:
         """Create a specific tetromino piece."""
-        if piece_type not in self._shapes_cache:
+        rotations = self._rotations.get(piece_type)
+        if rotations is None:
             self.error_handler.handle_validation_error(
                 "piece_type", piece_type, f"one of {self._piece_types}"
             )
             raise ValueError(f"Unknown piece type: {piece_type}")
         
         try:
-            config = self._shapes_cache[piece_type]
-            shapes = config["shapes"]
-            color = config["color"]
+            color = self._shapes_cache[piece_type]["color"]
             
             # Start with first rotation (index 0)
-            initial_shape = shapes[0]
+            shape, row_masks, cells, extents = rotations[0]
             
             piece = TetrominoState(
                 shape_type=piece_type,
                 x=3,  # Default spawn position
                 y=0,
                 rotation=0,
-                shape=initial_shape,
-                color=color
+                shape=shape,
+                color=color,
+                row_masks=row_masks,
+                cells=cells,
+                extents=extents
             )
             
-            self.logger.debug(f"Created piece: {piece_type}")
+            if self.logger.is_enabled_for(LogLevel.DEBUG):
+                self.logger.debug(f"Created piece: {piece_type}")
             return piece
             
         except (KeyError, IndexError) as e:
@@ -120,34 +186,30 @@ class TetrominoFactory(ITetrominoFactory, Injectable):
     
     def rotate_piece(self, piece: TetrominoState, direction: str) -> TetrominoState:
         """Rotate a piece in given direction."""
-        if direction not in ["left", "right"]:
+        step = _ROTATION_STEPS.get(direction)
+        if step is None:
             self.error_handler.handle_validation_error(
                 "direction", direction, "left or right"
             )
             raise ValueError(f"Invalid rotation direction: {direction}")
         
         try:
-            config = self._shapes_cache[piece.shape_type]
-            shapes = config["shapes"]
-            num_rotations = len(shapes)
-            
-            if direction == "right":
-                new_rotation = (piece.rotation + 1) % num_rotations
-            else:  # left
-                new_rotation = (piece.rotation - 1) % num_rotations
-            
-            new_shape = shapes[new_rotation]
+            rotations = self._rotations[piece.shape_type]
+            new_rotation = (piece.rotation + step) % len(rotations)
+            shape, row_masks, cells, extents = rotations[new_rotation]
             
             rotated_piece = TetrominoState(
                 shape_type=piece.shape_type,
                 x=piece.x,
                 y=piece.y,
                 rotation=new_rotation,
-                shape=new_shape,
-                color=piece.color
+                shape=shape,
+                color=piece.color,
+                row_masks=row_masks,
+                cells=cells,
+                extents=extents
             )
             
-            self.logger.debug(f"Rotated piece {piece.shape_type} {direction}")
             return rotated_piece
             
         except (KeyError, IndexError) as e:
@@ -163,12 +225,12 @@ class TetrominoFactory(ITetrominoFactory, Injectable):
                 y=piece.y + dy,
                 rotation=piece.rotation,
                 shape=piece.shape,
-                color=piece.color
+                color=piece.color,
+                row_masks=piece.row_masks,
+                cells=piece.cells,
+                extents=piece.extents
             )
             
-            if dx != 0 or dy != 0:
-                self.logger.debug(f"Moved piece {piece.shape_type} by ({dx}, {dy})")
-            
             return moved_piece
             
         except Exception as e:
@@ -199,42 +261,7 @@ class TetrominoFactory(ITetrominoFactory, Injectable):
     
     def validate_piece_configuration(self, piece_type: str) -> bool:
         """Validate piece configuration integrity."""
-        if piece_type not in self._shapes_cache:
-            return False
-        
-        try:
-            config = self._shapes_cache[piece_type]
-            
-            # Check required fields
-            if "shapes" not in config or "color" not in config:
-                return False
-            
-            shapes = config["shapes"]
-            if not shapes or not isinstance(shapes, list):
-                return False
-            
-            # Validate each shape
-            for shape in shapes:
-                if not isinstance(shape, list) or len(shape) != 4:
-                    return False
-                
-                for row in shape:
-                    if not isinstance(row, list) or len(row) != 4:
-                        return False
-                    
-                    for cell in row:
-                        if not isinstance(cell, int) or cell not in [0, 1]:
-                            return False
-            
-            # Validate color
-            color = config["color"]
-            if not isinstance(color, int) or color < 1 or color > 9:
-                return False
-            
-            return True
-            
-        except Exception:
-            return False
+        return self._valid_types.get(piece_type, False)
     
     def reload_configurations(self) -> None:
         """Reload piece configurations from config manager."""
@@ -248,40 +275,6 @@ class TetrominoFactory(ITetrominoFactory, Injectable):
             self.error_handler.handle_error(e, "reloading tetromino configurations")
             raise RuntimeError(f"Failed to reload configurations: {e}")
     
-    def get_piece_preview(self, piece_type: str, max_size: tuple = (4, 2)) -> List[List[int]]:
+    def get_piece_preview(self, piece_type: str, rotation: int = 0) -> Tuple[Tuple[int, ...], ...]:
         """Get a compact preview of a piece for UI display."""
-        if piece_type not in self._shapes_cache:
-            return [[0]]
-        
-        try:
-            config = self._shapes_cache[piece_type]
-            shape = config["shapes"][0]  # Use first rotation
-            
-            # Find actual bounds of the piece
-            min_row, max_row = 4, -1
-            min_col, max_col = 4, -1
-            
-            for row_idx, row in enumerate(shape):
-                for col_idx, cell in enumerate(row):
-                    if cell:
-                        min_row = min(min_row, row_idx)
-                        max_row = max(max_row, row_idx)
-                        min_col = min(min_col, col_idx)
-                        max_col = max(max_col, col_idx)
-            
-            if max_row == -1:  # Empty piece
-                return [[0]]
-            
-            # Extract the minimal bounding box
-            preview = []
-            for row_idx in range(min_row, max_row + 1):
-                preview_row = []
-                for col_idx in range(min_col, max_col + 1):
-                    preview_row.append(shape[row_idx][col_idx])
-                preview.append(preview_row)
-            
-            return preview
-            
-        except Exception as e:
-            self.error_handler.handle_error(e, f"generating preview for {piece_type}")
-            return [[1]]  # Simple fallback
\ No newline at end of file
+        return self._previews.get((piece_type, rotation), ((0,),))
@@ -5,11 +5,13 @@ from .dependency_injection import Container, Injectable
 from .game_state import GameState, GameStateManager
 from .event_system import Event, EventBus, EventHandler
 from .logger import Logger, LogLevel
+from .input_actions import InputAction
 
 __all__ = [
     'ConfigManager', 'GameConfig', 'ScoringConfig', 'DisplayConfig', 'ControlsConfig',
     'Container', 'Injectable',
     'GameState', 'GameStateManager',
     'Event', 'EventBus', 'EventHandler',
-    'Logger', 'LogLevel'
+    'Logger', 'LogLevel',
+    'InputAction'
 ]
\ No newline at end of file
@@ -5,6 +5,11 @@ import os
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
 
 @dataclass
 class GameConfig:
@@ -94,8 +99,12 @@ class ConfigManager:
         """Load configuration from file."""
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self._config_data = json.load(f)
+                if orjson is not None:
+                    with open(self.config_path, 'rb') as f:
+                        self._config_data = orjson.loads(f.read())
+                else:
+                    with open(self.config_path, 'r', encoding='utf-8') as f:
+                        self._config_data = json.load(f)
             else:
                 self._config_data = {}
                 self.save_config()  # Create default config file
@@ -105,8 +114,13 @@ class ConfigManager:
     def save_config(self) -> None:
         """Save current configuration to file."""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(self.config_path, 'wb') as f:
+                    f.write(orjson.dumps(self._config_data,
+                                         option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(self.config_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._config_data, f, indent=2, ensure_ascii=False)
         except IOError as e:
             raise ConfigurationError(f"Failed to save configuration: {e}")
     
@@ -144,10 +158,10 @@ class ConfigManager:
     
     def get_tetromino_config(self, piece_type: str) -> Dict[str, Any]:
         """Get tetromino configuration for specific piece type."""
-        tetrominoes = self._config_data.get('tetrominoes', {})
-        if piece_type not in tetrominoes:
-            raise ConfigurationError(f"Unknown tetromino type: {piece_type}")
-        return tetrominoes[piece_type]
+        try:
+            return self._config_data.get('tetrominoes', {})[piece_type]
+        except KeyError:
+            raise ConfigurationError(f"Unknown tetromino type: {piece_type}") from None
     
     def get_all_tetromino_types(self) -> List[str]:
         """Get list of all available tetromino types."""
@@ -1,16 +1,31 @@
 """Dependency injection container for managing component dependencies."""
 
-from typing import Dict, Type, TypeVar, Any, Callable, Optional
+from typing import Dict, List, Tuple, Type, TypeVar, Any, Callable, Optional
 from abc import ABC, abstractmethod
+from functools import lru_cache
 import inspect
 
 
 T = TypeVar('T')
 
+_EMPTY = inspect.Parameter.empty
+_VARIADIC = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
+@lru_cache(maxsize=None)
+def _sig_params(cls: Type) -> tuple:
+    """Return (name, annotation, default) for each constructor parameter of cls."""
+    sig = inspect.signature(cls.__init__)
+    return tuple((name, param.annotation, param.default)
+                 for name, param in sig.parameters.items()
+                 if name != 'self' and param.kind not in _VARIADIC)
+
 
 class Injectable(ABC):
     """Base class for injectable components."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def initialize(self, container: 'Container') -> None:
         """Initialize the component with dependencies from container."""
@@ -55,21 +70,22 @@ class Container:
     
     def get(self, interface: Type[T]) -> T:
         """Get an instance of the requested interface."""
-        # Check for pre-registered instances first
-        if interface in self._singletons:
+        # Instances and built singletons resolve with a single lookup
+        try:
             return self._singletons[interface]
+        except KeyError:
+            pass
         
         # Check for factory functions
-        if interface in self._factories:
-            return self._factories[interface]()
+        factory = self._factories.get(interface)
+        if factory is not None:
+            return factory()
         
-        # Check for singleton services
+        # Build singleton services requested before initialize()
         if interface in self._services:
-            if interface not in self._singletons:
-                implementation = self._services[interface]
-                instance = self._create_instance(implementation)
-                self._singletons[interface] = instance
-            return self._singletons[interface]
+            instance = self._create_instance(self._services[interface])
+            self._singletons[interface] = instance
+            return instance
         
         raise ContainerError(f"No registration found for {interface}")
     
@@ -78,11 +94,11 @@ class Container:
         if self._initialized:
             return
         
-        # Initialize all singleton services
-        for interface, implementation in self._services.items():
+        # Build every singleton once, dependencies first
+        for interface in self._resolution_order():
             if interface not in self._singletons:
-                instance = self._create_instance(implementation)
-                self._singletons[interface] = instance
+                implementation = self._services[interface]
+                self._singletons[interface] = self._create_instance(implementation)
         
         # Initialize injectable components
         for instance in self._singletons.values():
@@ -91,31 +107,54 @@ class Container:
         
         self._initialized = True
     
-    def _create_instance(self, implementation: Type[T]) -> T:
-        """Create an instance with dependency injection."""
-        # Get constructor parameters
-        sig = inspect.signature(implementation.__init__)
-        params = {}
+    def _resolution_order(self) -> List[Type]:
+        """Return singleton interfaces sorted so dependencies come before dependents."""
+        order: List[Type] = []
+        visiting = set()
+        done = set()
+        
+        def visit(interface: Type) -> None:
+            if interface in done:
+                return
+            if interface in visiting:
+                raise ContainerError(f"Circular dependency involving {interface}")
+            visiting.add(interface)
+            for _, dependency in self._plan(self._services[interface]):
+                if dependency in self._services:
+                    visit(dependency)
+            visiting.discard(interface)
+            done.add(interface)
+            order.append(interface)
+        
+        for interface in self._services:
+            visit(interface)
+        return order
+    
+    def _plan(self, implementation: Type) -> List[Tuple[str, Type]]:
+        """Return (parameter, interface) pairs to inject into the constructor."""
+        plan = []
         
-        for param_name, param in sig.parameters.items():
-            if param_name == 'self':
-                continue
-            
-            if param.annotation != inspect.Parameter.empty:
-                try:
-                    params[param_name] = self.get(param.annotation)
-                except ContainerError:
-                    if param.default == inspect.Parameter.empty:
-                        raise ContainerError(
-                            f"Cannot resolve dependency {param.annotation} for {implementation}"
-                        )
-                    # Use default value if dependency cannot be resolved
-            elif param.default == inspect.Parameter.empty:
+        for param_name, annotation, default in _sig_params(implementation):
+            if annotation is not _EMPTY:
+                if (annotation in self._singletons or annotation in self._factories
+                        or annotation in self._services):
+                    plan.append((param_name, annotation))
+                elif default is _EMPTY:
+                    raise ContainerError(
+                        f"Cannot resolve dependency {annotation} for {implementation}"
+                    )
+                # Use default value if dependency cannot be resolved
+            elif default is _EMPTY:
                 raise ContainerError(
                     f"Parameter {param_name} in {implementation} has no type annotation"
                 )
         
-        return implementation(**params)
+        return plan
+    
+    def _create_instance(self, implementation: Type[T]) -> T:
+        """Create an instance with dependency injection."""
+        return implementation(**{name: self.get(dependency)
+                                 for name, dependency in self._plan(implementation)})
     
     def reset(self) -> None:
         """Reset the container to uninitialized state."""
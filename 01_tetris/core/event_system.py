@@ -1,9 +1,12 @@
 """Event-driven system for component communication."""
 
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Collection, Dict, List, Optional, Type
+from collections import deque
 from dataclasses import dataclass
+from itertools import islice
 from abc import ABC, abstractmethod
 from enum import Enum
+import threading
 import time
 import weakref
 
@@ -42,7 +45,7 @@ class EventType(Enum):
     CONFIG_CHANGED = "config_changed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Event data structure."""
     event_type: EventType
@@ -64,8 +67,8 @@ class EventHandler(ABC):
         pass
     
     @abstractmethod
-    def get_handled_events(self) -> List[EventType]:
-        """Return list of event types this handler processes."""
+    def get_handled_events(self) -> Collection[EventType]:
+        """Return the event types this handler processes."""
         pass
 
 
@@ -73,19 +76,33 @@ class EventBus:
     """Central event bus for publishing and subscribing to events."""
     
     def __init__(self):
-        self._handlers: Dict[EventType, List[weakref.ReferenceType]] = {}
-        self._event_history: List[Event] = []
+        # Copy-on-write handler snapshots: writers swap in a new dict under the
+        # lock, publishers iterate whatever dict they read without it. Entries are
+        # keyed by id(handler) so handlers need not be hashable, and stay in
+        # subscription order.
+        self._handlers: Dict[EventType, Dict[int, weakref.ReferenceType]] = {}
+        self._handlers_lock = threading.RLock()
         self._max_history_size = 1000
+        self._event_history: deque = deque(maxlen=self._max_history_size)
+        # Per-type view of the same history, trimmed in step with it
+        self._history_by_type: Dict[EventType, deque] = {}
         self._enabled = True
     
     def subscribe(self, event_type: EventType, handler: EventHandler) -> None:
         """Subscribe a handler to an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        
-        # Use weak reference to prevent memory leaks
-        weak_handler = weakref.ref(handler, self._cleanup_handler)
-        self._handlers[event_type].append(weak_handler)
+        key = id(handler)
+        with self._handlers_lock:
+            current = self._handlers.get(event_type, {})
+            existing = current.get(key)
+            if existing is not None and existing() is handler:
+                return
+            
+            # Use weak reference to prevent memory leaks
+            handlers = dict(current)
+            handlers[key] = weakref.ref(
+                handler, lambda weak_ref: self._drop_handler(event_type, key, weak_ref)
+            )
+            self._handlers[event_type] = handlers
     
     def subscribe_multiple(self, handler: EventHandler) -> None:
         """Subscribe a handler to all its handled event types."""
@@ -94,49 +111,48 @@ class EventBus:
     
     def unsubscribe(self, event_type: EventType, handler: EventHandler) -> None:
         """Unsubscribe a handler from an event type."""
-        if event_type not in self._handlers:
-            return
-        
-        # Remove handler from list
-        self._handlers[event_type] = [
-            weak_ref for weak_ref in self._handlers[event_type]
-            if weak_ref() is not handler
-        ]
-        
-        # Clean up empty lists
-        if not self._handlers[event_type]:
-            del self._handlers[event_type]
+        with self._handlers_lock:
+            weak_ref = self._handlers.get(event_type, {}).get(id(handler))
+            if weak_ref is not None and weak_ref() is handler:
+                self._drop_handler(event_type, id(handler), weak_ref)
     
     def publish(self, event: Event) -> None:
         """Publish an event to all subscribed handlers."""
         if not self._enabled:
             return
         
-        # Add to history
-        self._add_to_history(event)
+        # Add to history; evict the oldest event from its type's view as well
+        history = self._event_history
+        if len(history) == self._max_history_size:
+            self._history_by_type[history[0].event_type].popleft()
+        history.append(event)
+        typed = self._history_by_type.get(event.event_type)
+        if typed is None:
+            typed = self._history_by_type[event.event_type] = deque()
+        typed.append(event)
         
-        # Get handlers for this event type
-        handlers = self._handlers.get(event.event_type, [])
+        # Read the current snapshot; no lock needed
+        handlers = self._handlers.get(event.event_type)
+        if not handlers:
+            return
         
-        # Clean up dead references and call active handlers
-        active_handlers = []
-        for weak_handler in handlers:
+        for weak_handler in handlers.values():
             handler = weak_handler()
-            if handler is not None:
-                active_handlers.append(weak_handler)
-                try:
-                    handler.handle_event(event)
-                except Exception as e:
-                    # Log error but don't break other handlers
-                    print(f"Error handling event {event.event_type}: {e}")
-        
-        # Update handlers list with only active references
-        if len(active_handlers) != len(handlers):
-            self._handlers[event.event_type] = active_handlers
+            if handler is None:
+                continue
+            try:
+                handler.handle_event(event)
+            except Exception as e:
+                # Log error but don't break other handlers
+                print(f"Error handling event {event.event_type}: {e}")
     
     def publish_event(self, event_type: EventType, data: Dict[str, Any] = None, 
                      source: str = None) -> None:
         """Convenience method to create and publish an event."""
+        # A disabled bus would drop the event anyway, so don't build it
+        if not self._enabled:
+            return
+        
         event = Event(
             event_type=event_type,
             data=data or {},
@@ -148,19 +164,20 @@ class EventBus:
     def get_event_history(self, event_type: Optional[EventType] = None, 
                          limit: Optional[int] = None) -> List[Event]:
         """Get event history, optionally filtered by type and limited."""
-        events = self._event_history
-        
         if event_type:
-            events = [e for e in events if e.event_type == event_type]
+            history = self._history_by_type.get(event_type, ())
+        else:
+            history = self._event_history
         
         if limit:
-            events = events[-limit:]
+            return list(islice(history, max(0, len(history) - limit), None))
         
-        return events[:]  # Return copy
+        return list(history)
     
     def clear_history(self) -> None:
         """Clear event history."""
         self._event_history.clear()
+        self._history_by_type.clear()
     
     def enable(self) -> None:
         """Enable event publishing."""
@@ -174,27 +191,36 @@ class EventBus:
         """Check if event bus is enabled."""
         return self._enabled
     
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """Check cheaply whether any handler is subscribed to an event type."""
+        return bool(self._handlers.get(event_type))
+    
     def get_handler_count(self, event_type: EventType) -> int:
         """Get number of active handlers for an event type."""
-        handlers = self._handlers.get(event_type, [])
-        return len([h for h in handlers if h() is not None])
+        handlers = self._handlers.get(event_type, {})
+        return sum(1 for weak_ref in handlers.values() if weak_ref() is not None)
     
     def get_all_event_types(self) -> List[EventType]:
         """Get all event types that have handlers."""
         return list(self._handlers.keys())
     
-    def _add_to_history(self, event: Event) -> None:
-        """Add event to history with size limit."""
-        self._event_history.append(event)
-        
-        # Trim history if it exceeds maximum size
-        if len(self._event_history) > self._max_history_size:
-            self._event_history = self._event_history[-self._max_history_size:]
-    
-    def _cleanup_handler(self, weak_ref: weakref.ReferenceType) -> None:
-        """Clean up dead handler references."""
-        for event_type, handlers in self._handlers.items():
-            self._handlers[event_type] = [h for h in handlers if h is not weak_ref]
+    def _drop_handler(self, event_type: EventType, key: int,
+                      weak_ref: weakref.ReferenceType) -> None:
+        """Remove one handler reference, unless its slot was reused since."""
+        with self._handlers_lock:
+            handlers = self._handlers.get(event_type)
+            if handlers is None or handlers.get(key) is not weak_ref:
+                return
+            
+            # Remove handler from snapshot
+            remaining = dict(handlers)
+            del remaining[key]
+            
+            # Clean up empty snapshots
+            if remaining:
+                self._handlers[event_type] = remaining
+            else:
+                del self._handlers[event_type]
 
 
 class CompositeEventHandler(EventHandler):
@@ -1,7 +1,7 @@
 """Centralized game state management for Tetris."""
 
-from dataclasses import dataclass, replace
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass, field, replace
+from typing import Optional, List, Dict, Any, Tuple
 from enum import Enum
 import copy
 
@@ -15,7 +15,52 @@ class GameStatus(Enum):
     FINISHED = "finished"
 
 
-@dataclass(frozen=True)
+def compute_row_masks(shape: List[List[int]]) -> Tuple[int, ...]:
+    """Pack each shape row into an int bitmask (bit 0 = leftmost column)."""
+    return tuple(
+        sum(1 << col for col, cell in enumerate(row) if cell)
+        for row in shape
+    )
+
+
+def compute_cells(shape: List[List[int]]) -> Tuple[Tuple[int, int], ...]:
+    """List occupied (dx, dy) offsets of a shape."""
+    return tuple(
+        (col, row)
+        for row, cells in enumerate(shape)
+        for col, cell in enumerate(cells)
+        if cell
+    )
+
+
+def compute_extents(shape: List[List[int]]) -> Tuple[int, int, int]:
+    """Get (min_dx, max_dx, max_dy) of a shape's occupied cells."""
+    cells = compute_cells(shape)
+    if not cells:
+        return (0, -1, -1)
+    return (
+        min(dx for dx, _ in cells),
+        max(dx for dx, _ in cells),
+        max(dy for _, dy in cells)
+    )
+
+
+def compute_preview(shape: List[List[int]]) -> Tuple[Tuple[int, ...], ...]:
+    """Crop a shape to the bounding box of its occupied cells."""
+    cells = compute_cells(shape)
+    if not cells:
+        return ((0,),)
+    min_dx = min(dx for dx, _ in cells)
+    max_dx = max(dx for dx, _ in cells)
+    min_dy = min(dy for _, dy in cells)
+    max_dy = max(dy for _, dy in cells)
+    return tuple(
+        tuple(shape[row][min_dx:max_dx + 1])
+        for row in range(min_dy, max_dy + 1)
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class TetrominoState:
     """Immutable tetromino state."""
     shape_type: str
@@ -24,9 +69,21 @@ class TetrominoState:
     rotation: int
     shape: List[List[int]]
     color: int
+    row_masks: Tuple[int, ...] = field(default=None, compare=False, repr=False)
+    cells: Tuple[Tuple[int, int], ...] = field(default=None, compare=False, repr=False)
+    extents: Tuple[int, int, int] = field(default=None, compare=False, repr=False)
+    
+    def __post_init__(self):
+        # Derive shape tables when the factory did not supply cached ones
+        if self.row_masks is None:
+            object.__setattr__(self, 'row_masks', compute_row_masks(self.shape or []))
+        if self.cells is None:
+            object.__setattr__(self, 'cells', compute_cells(self.shape or []))
+        if self.extents is None:
+            object.__setattr__(self, 'extents', compute_extents(self.shape or []))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameState:
     """Immutable game state representation."""
     
@@ -69,7 +126,7 @@ class GameState:
             # Create empty board
             empty_board = [[0 for _ in range(self.board_width)] 
                           for _ in range(self.board_height)]
-            super().__setattr__('board', empty_board)
+            object.__setattr__(self, 'board', empty_board)
 
 
 class GameStateManager:
@@ -79,12 +136,18 @@ class GameStateManager:
         self._current_state = initial_state or GameState()
         self._state_history: List[GameState] = [self._current_state]
         self._max_history_size = 100
+        self._epoch = 0
     
     @property
     def current_state(self) -> GameState:
         """Get current game state."""
         return self._current_state
     
+    @property
+    def epoch(self) -> int:
+        """Get a counter that increases on every state change."""
+        return self._epoch
+    
     def update_state(self, **changes) -> GameState:
         """Create new state with changes and validate it."""
         new_state = replace(self._current_state, **changes)
@@ -92,11 +155,40 @@ class GameStateManager:
         # Validate the new state
         self._validate_state(new_state)
         
-        # Update current state and history
-        self._current_state = new_state
-        self._add_to_history(new_state)
-        
-        return new_state
+        return self._commit(new_state)
+    
+    # The piece mutators below leave the board untouched and are only called
+    # with positions GameBoard already accepted, so they skip _validate_state
+    
+    def apply_move(self, piece: TetrominoState, ghost_piece: TetrominoState) -> GameState:
+        """Move the current piece after a successful fall, clearing lock state."""
+        return self._commit(replace(
+            self._current_state,
+            current_piece=piece,
+            ghost_piece=ghost_piece,
+            is_grounded=False,
+            lock_timer=0,
+            move_resets=0
+        ))
+    
+    def set_piece(self, piece: TetrominoState, ghost_piece: TetrominoState,
+                  move_resets: int, lock_timer: int) -> GameState:
+        """Replace the current piece after a player move or rotation."""
+        return self._commit(replace(
+            self._current_state,
+            current_piece=piece,
+            ghost_piece=ghost_piece,
+            move_resets=move_resets,
+            lock_timer=lock_timer
+        ))
+    
+    def set_grounded(self, lock_timer: int) -> GameState:
+        """Mark the current piece as grounded and start the lock timer."""
+        return self._commit(replace(
+            self._current_state,
+            is_grounded=True,
+            lock_timer=lock_timer
+        ))
     
     def update_board(self, new_board: List[List[int]]) -> GameState:
         """Update board state with validation."""
@@ -130,6 +222,21 @@ class GameStateManager:
             fall_speed=new_fall_speed
         )
     
+    def apply_lock(self, points: int, lines_cleared: int, **changes) -> GameState:
+        """Credit a locked piece's points and lines together with its other changes."""
+        new_score = self._current_state.score + points
+        new_lines_total = self._current_state.lines_cleared + lines_cleared
+        new_level = self._calculate_level(new_score, new_lines_total)
+        new_fall_speed = self._calculate_fall_speed(new_level)
+        
+        return self.update_state(
+            score=new_score,
+            lines_cleared=new_lines_total,
+            level=new_level,
+            fall_speed=new_fall_speed,
+            **changes
+        )
+    
     def clear_lines(self, lines_cleared: int) -> GameState:
         """Update state after clearing lines."""
         new_lines_total = self._current_state.lines_cleared + lines_cleared
@@ -147,6 +254,7 @@ class GameStateManager:
         initial_state = GameState(status=GameStatus.PLAYING)
         self._current_state = initial_state
         self._state_history = [initial_state]
+        self._epoch += 1
         return initial_state
     
     def get_previous_state(self, steps_back: int = 1) -> Optional[GameState]:
@@ -247,21 +355,19 @@ class GameStateManager:
     
     def _validate_piece_position(self, piece: TetrominoState, board: List[List[int]]) -> bool:
         """Validate that piece position is valid on board."""
-        # Basic bounds checking
-        if piece.x < 0 or piece.y < 0:
-            return False
+        # Same rule as GameBoard: occupied cells stay inside the walls and above
+        # the floor, may sit above the board, and must not overlap placed blocks
+        height = len(board)
+        width = len(board[0])
         
-        # Check shape doesn't extend beyond board
-        for row_idx, row in enumerate(piece.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    board_x = piece.x + col_idx
-                    board_y = piece.y + row_idx
-                    
-                    if (board_x >= len(board[0]) or 
-                        board_y >= len(board) or
-                        board[board_y][board_x] != 0):
-                        return False
+        for dx, dy in piece.cells:
+            board_x = piece.x + dx
+            board_y = piece.y + dy
+            
+            if board_x < 0 or board_x >= width or board_y >= height:
+                return False
+            if board_y >= 0 and board[board_y][board_x] != 0:
+                return False
         
         return True
     
@@ -273,6 +379,13 @@ class GameStateManager:
         """Calculate fall speed based on level."""
         return max(50, 500 - (level - 1) * 50)
     
+    def _commit(self, new_state: GameState) -> GameState:
+        """Install a new state, record it in history and bump the epoch."""
+        self._current_state = new_state
+        self._add_to_history(new_state)
+        self._epoch += 1
+        return new_state
+    
     def _add_to_history(self, state: GameState) -> None:
         """Add state to history with size limit."""
         self._state_history.append(state)
@@ -0,0 +1,28 @@
+"""Input action identifiers shared by input handlers and the game engine."""
+
+from enum import IntEnum
+
+
+class InputAction(IntEnum):
+    """Player actions, translated from raw keys at the input boundary.
+    
+    Values start at 1 so every action is truthy, like the key strings they replace.
+    """
+    QUIT = 1
+    PAUSE = 2
+    MOVE_LEFT = 3
+    MOVE_RIGHT = 4
+    SOFT_DROP = 5
+    HARD_DROP = 6
+    ROTATE_RIGHT = 7
+    ROTATE_LEFT = 8
+    
+    @property
+    def config_name(self) -> str:
+        """Get the action name used in the controls configuration."""
+        return self.name.lower()
+    
+    @classmethod
+    def from_config_name(cls, name: str) -> 'InputAction':
+        """Look up an action by its controls configuration name."""
+        return cls[name.upper()]
@@ -75,6 +75,10 @@ class Logger:
         """Clear logging context."""
         self._context.clear()
     
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Check whether a message at level would be emitted."""
+        return self._logger.isEnabledFor(getattr(logging, level.value))
+    
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message."""
         self._log(LogLevel.DEBUG, message, **kwargs)
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple
 from core.game_state import GameState, TetrominoState
 from core.event_system import Event
+from core.input_actions import InputAction
 
 
 class IRenderer(ABC):
@@ -73,16 +74,23 @@ class IRenderer(ABC):
 class IInputHandler(ABC):
     """Interface for input handling components."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def initialize_handler(self) -> None:
         """Initialize the input handler."""
         pass
     
     @abstractmethod
-    def get_input(self, timeout_ms: int = 100) -> Optional[str]:
+    def get_input(self, timeout_ms: int = 100) -> Optional[InputAction]:
         """Get input with optional timeout."""
         pass
     
+    @abstractmethod
+    def poll_once(self, timeout_ms: int = 100) -> Optional[InputAction]:
+        """Read at most one input for this frame and cache it."""
+        pass
+    
     @abstractmethod
     def is_quit_requested(self) -> bool:
         """Check if quit was requested."""
@@ -94,12 +102,12 @@ class IInputHandler(ABC):
         pass
     
     @abstractmethod
-    def get_movement_input(self) -> Optional[str]:
+    def get_movement_input(self) -> Optional[InputAction]:
         """Get movement input (left, right, down)."""
         pass
     
     @abstractmethod
-    def get_rotation_input(self) -> Optional[str]:
+    def get_rotation_input(self) -> Optional[InputAction]:
         """Get rotation input (rotate_left, rotate_right)."""
         pass
     
@@ -117,6 +125,8 @@ class IInputHandler(ABC):
 class IGameBoard(ABC):
     """Interface for game board components."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def initialize_board(self, width: int, height: int) -> None:
         """Initialize the board with given dimensions."""
@@ -132,6 +142,11 @@ class IGameBoard(ABC):
         """Check if piece position is valid on board."""
         pass
     
+    @abstractmethod
+    def is_valid_offset(self, piece: TetrominoState, dx: int, dy: int) -> bool:
+        """Check if piece would be valid after moving by (dx, dy)."""
+        pass
+    
     @abstractmethod
     def place_piece(self, piece: TetrominoState) -> None:
         """Place piece on the board."""
@@ -221,8 +236,8 @@ class IGameEngine(ABC):
         pass
     
     @abstractmethod
-    def handle_input(self, input_key: str) -> None:
-        """Handle input key."""
+    def handle_input(self, action: InputAction) -> None:
+        """Handle an input action."""
         pass
     
     @abstractmethod
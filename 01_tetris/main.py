@@ -10,7 +10,7 @@ import time
 from typing import Optional
 
 # Import new architecture components
-from core import ConfigManager, Container
+from core import ConfigManager, Container, InputAction
 from interfaces.game_interfaces import (
     IGameEngine, IRenderer, IInputHandler, IGameBoard, 
     ITetrominoFactory, IScoreCalculator
@@ -93,12 +93,12 @@ class GameApplication:
                     last_time = current_time
                     
                     # Handle input
-                    input_action = input_handler.get_input(50)  # 50ms timeout
-                    if input_action:
+                    input_action = input_handler.poll_once(50)  # 50ms timeout
+                    if input_action is not None:
                         self.game_engine.handle_input(input_action)
                         
                         # Check for quit
-                        if input_action == 'quit':
+                        if input_action == InputAction.QUIT:
                             self._running = False
                             break
                     
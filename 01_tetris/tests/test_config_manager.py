@@ -83,6 +83,15 @@ class TestConfigManager(unittest.TestCase):
         self.assertIn("I", types)
         self.assertEqual(len(types), 1)
     
+    def test_update_config_round_trip(self):
+        """Test an updated section is saved and read back."""
+        config_manager = ConfigManager(self.config_file)
+        config_manager.update_config("game", {"board_width": 12, "board_height": 22})
+        
+        reloaded = ConfigManager(self.config_file)
+        self.assertEqual(reloaded.game.board_width, 12)
+        self.assertEqual(reloaded.get_tetromino_config("I")["color"], 6)
+    
     def test_invalid_json(self):
         """Test handling invalid JSON file."""
         with open(self.config_file, 'w') as f:
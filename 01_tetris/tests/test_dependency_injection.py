@@ -0,0 +1,107 @@
+"""Tests for dependency injection container."""
+
+import unittest
+from core.dependency_injection import Container, ContainerError, Injectable
+
+
+class Clock:
+    """Leaf service without dependencies."""
+    pass
+
+
+class Store:
+    """Service depending on Clock."""
+    
+    def __init__(self, clock: Clock):
+        self.clock = clock
+
+
+class Service(Injectable):
+    """Injectable service depending on Store, with an optional setting."""
+    
+    def __init__(self, store: Store, retries: int = 3):
+        self.store = store
+        self.retries = retries
+        self.initialized = False
+    
+    def initialize(self, container: Container) -> None:
+        """Record initialization."""
+        self.initialized = True
+
+
+class Ping:
+    """One half of a dependency cycle."""
+    
+    def __init__(self, pong: 'Pong'):
+        self.pong = pong
+
+
+class Pong:
+    """Other half of a dependency cycle."""
+    
+    def __init__(self, ping: Ping):
+        self.ping = ping
+
+
+Ping.__init__.__annotations__['pong'] = Pong
+
+
+class TestContainer(unittest.TestCase):
+    """Test cases for Container."""
+    
+    def setUp(self):
+        """Set up test environment."""
+        self.container = Container()
+    
+    def test_initialize_builds_dependencies_first(self):
+        """Test singletons are built in dependency order regardless of registration order."""
+        self.container.register_singleton(Service, Service)
+        self.container.register_singleton(Store, Store)
+        self.container.register_singleton(Clock, Clock)
+        self.container.initialize()
+        
+        service = self.container.get(Service)
+        self.assertIs(service.store, self.container.get(Store))
+        self.assertIs(service.store.clock, self.container.get(Clock))
+        self.assertEqual(service.retries, 3)
+        self.assertTrue(service.initialized)
+    
+    def test_registered_instance_is_injected(self):
+        """Test a registered instance satisfies constructor dependencies."""
+        clock = Clock()
+        self.container.register_instance(Clock, clock)
+        self.container.register_singleton(Store, Store)
+        self.container.initialize()
+        
+        self.assertIs(self.container.get(Store).clock, clock)
+    
+    def test_factory_called_per_get(self):
+        """Test factories create a new instance on every get."""
+        self.container.register_factory(Clock, Clock)
+        self.container.initialize()
+        
+        self.assertIsNot(self.container.get(Clock), self.container.get(Clock))
+    
+    def test_missing_dependency(self):
+        """Test an unresolvable dependency without a default fails on initialize."""
+        self.container.register_singleton(Store, Store)
+        
+        with self.assertRaises(ContainerError):
+            self.container.initialize()
+    
+    def test_circular_dependency(self):
+        """Test a dependency cycle is reported instead of recursing."""
+        self.container.register_singleton(Ping, Ping)
+        self.container.register_singleton(Pong, Pong)
+        
+        with self.assertRaises(ContainerError):
+            self.container.initialize()
+    
+    def test_unknown_interface(self):
+        """Test getting an unregistered interface."""
+        with self.assertRaises(ContainerError):
+            self.container.get(Clock)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""Tests for event system."""
+
+import gc
+import unittest
+from core.event_system import EventBus, EventHandler, EventType
+
+
+class RecordingHandler(EventHandler):
+    """Handler that records received events."""
+
+    def __init__(self, event_types):
+        self.event_types = event_types
+        self.received = []
+
+    def handle_event(self, event):
+        self.received.append(event.event_type)
+
+    def get_handled_events(self):
+        return self.event_types
+
+
+class TestEventBus(unittest.TestCase):
+    """Test cases for EventBus."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.bus = EventBus()
+
+    def test_publish_to_subscribers(self):
+        """Test events reach only subscribed handlers."""
+        handler = RecordingHandler([EventType.LINES_CLEARED])
+        self.bus.subscribe_multiple(handler)
+
+        self.bus.publish_event(EventType.LINES_CLEARED, {"lines_cleared": 1})
+        self.bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(handler.received, [EventType.LINES_CLEARED])
+        self.assertEqual(len(self.bus.get_event_history()), 2)
+
+    def test_unsubscribe(self):
+        """Test unsubscribed handlers stop receiving events."""
+        handler = RecordingHandler([EventType.GAME_OVER])
+        self.bus.subscribe_multiple(handler)
+        self.bus.unsubscribe(EventType.GAME_OVER, handler)
+
+        self.bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(handler.received, [])
+        self.assertFalse(self.bus.has_subscribers(EventType.GAME_OVER))
+
+    def test_unsubscribe_during_publish(self):
+        """Test a handler removed mid-publish does not disturb delivery."""
+        bus = self.bus
+        second = RecordingHandler([EventType.GAME_OVER])
+
+        class Unsubscriber(RecordingHandler):
+            def handle_event(self, event):
+                super().handle_event(event)
+                bus.unsubscribe(EventType.GAME_OVER, second)
+
+        first = Unsubscriber([EventType.GAME_OVER])
+        bus.subscribe_multiple(first)
+        bus.subscribe_multiple(second)
+
+        bus.publish_event(EventType.GAME_OVER)
+        bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(len(first.received), 2)
+        self.assertEqual(len(second.received), 1)
+
+    def test_delivery_follows_subscription_order(self):
+        """Test handlers receive an event in the order they subscribed."""
+        order = []
+
+        class Tagged(RecordingHandler):
+            def handle_event(self, event):
+                order.append(self)
+
+        handlers = [Tagged([EventType.GAME_OVER]) for _ in range(5)]
+        for handler in handlers:
+            self.bus.subscribe_multiple(handler)
+        self.bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(order, handlers)
+
+    def test_disabled_bus_drops_events(self):
+        """Test a disabled bus neither delivers nor records events."""
+        handler = RecordingHandler([EventType.GAME_OVER])
+        self.bus.subscribe_multiple(handler)
+        self.bus.disable()
+        self.bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(handler.received, [])
+        self.assertEqual(self.bus.get_event_history(), [])
+
+    def test_history_is_bounded(self):
+        """Test history keeps only the newest events and honours limits."""
+        for i in range(1005):
+            self.bus.publish_event(EventType.SCORE_UPDATED, {"score": i})
+
+        history = self.bus.get_event_history()
+        self.assertEqual(len(history), 1000)
+        self.assertEqual(history[0].data["score"], 5)
+        self.assertEqual([e.data["score"] for e in self.bus.get_event_history(limit=2)], [1003, 1004])
+        self.assertEqual(self.bus.get_event_history(EventType.GAME_OVER), [])
+
+    def test_history_filtered_by_type(self):
+        """Test the per-type history follows evictions from the shared history."""
+        self.bus.publish_event(EventType.GAME_OVER)
+        for i in range(999):
+            self.bus.publish_event(EventType.SCORE_UPDATED, {"score": i})
+        self.assertEqual(len(self.bus.get_event_history(EventType.GAME_OVER)), 1)
+
+        self.bus.publish_event(EventType.LINES_CLEARED, {"lines": 2})
+        self.bus.publish_event(EventType.LINES_CLEARED, {"lines": 4})
+
+        self.assertEqual(self.bus.get_event_history(EventType.GAME_OVER), [])
+        self.assertEqual(len(self.bus.get_event_history(EventType.SCORE_UPDATED)), 998)
+        lines = self.bus.get_event_history(EventType.LINES_CLEARED, limit=1)
+        self.assertEqual([e.data["lines"] for e in lines], [4])
+
+    def test_handlers_are_tracked_by_identity(self):
+        """Test unhashable and equal handlers each get their own subscription."""
+        class ValueHandler(RecordingHandler):
+            def __eq__(self, other):
+                return isinstance(other, ValueHandler)
+
+        first = ValueHandler([EventType.GAME_OVER])
+        second = ValueHandler([EventType.GAME_OVER])
+        self.bus.subscribe_multiple(first)
+        self.bus.subscribe_multiple(second)
+        self.bus.subscribe_multiple(first)
+        self.bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(self.bus.get_handler_count(EventType.GAME_OVER), 2)
+        self.assertEqual(first.received, [EventType.GAME_OVER])
+        self.assertEqual(second.received, [EventType.GAME_OVER])
+
+        self.bus.unsubscribe(EventType.GAME_OVER, first)
+        self.bus.publish_event(EventType.GAME_OVER)
+        self.assertEqual(len(first.received), 1)
+        self.assertEqual(len(second.received), 2)
+
+    def test_dead_handlers_are_dropped(self):
+        """Test garbage-collected handlers are removed."""
+        handler = RecordingHandler([EventType.GAME_OVER])
+        self.bus.subscribe_multiple(handler)
+        del handler
+        gc.collect()
+
+        self.bus.publish_event(EventType.GAME_OVER)
+
+        self.assertEqual(self.bus.get_handler_count(EventType.GAME_OVER), 0)
+        self.assertFalse(self.bus.has_subscribers(EventType.GAME_OVER))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,267 @@
+"""Tests for game board."""
+
+import unittest
+from unittest import mock
+from core.game_state import TetrominoState
+from components import game_board
+from components.game_board import GameBoard
+
+
+I_HORIZONTAL = [[0,0,0,0], [1,1,1,1], [0,0,0,0], [0,0,0,0]]
+I_VERTICAL = [[0,0,1,0], [0,0,1,0], [0,0,1,0], [0,0,1,0]]
+O_SHAPE = [[0,1,1,0], [0,1,1,0], [0,0,0,0], [0,0,0,0]]
+
+
+def make_piece(shape, x, y, color=6, shape_type="I"):
+    """Create a piece at the given position."""
+    return TetrominoState(
+        shape_type=shape_type,
+        x=x,
+        y=y,
+        rotation=0,
+        shape=shape,
+        color=color
+    )
+
+
+class TestGameBoard(unittest.TestCase):
+    """Test cases for GameBoard."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.board = GameBoard()
+        self.board.initialize_board(10, 20)
+
+    def fill_row(self, y, color=1, skip=()):
+        """Fill a board row through the public API, leaving columns in skip empty."""
+        for x in range(10):
+            if x not in skip:
+                self.board.place_piece(make_piece([[1]], x, y, color))
+
+    def test_empty_board(self):
+        """Test freshly initialized board."""
+        board = self.board.get_board()
+
+        self.assertEqual(len(board), 20)
+        self.assertEqual(len(board[0]), 10)
+        self.assertTrue(all(cell == 0 for row in board for cell in row))
+
+    def test_valid_position(self):
+        """Test position validation against walls and floor."""
+        self.assertTrue(self.board.is_valid_position(make_piece(I_HORIZONTAL, 0, 0)))
+        self.assertTrue(self.board.is_valid_position(make_piece(I_HORIZONTAL, 6, 0)))
+        self.assertFalse(self.board.is_valid_position(make_piece(I_HORIZONTAL, 7, 0)))
+        self.assertFalse(self.board.is_valid_position(make_piece(I_HORIZONTAL, -1, 0)))
+        self.assertFalse(self.board.is_valid_position(make_piece(I_HORIZONTAL, 0, 19)))
+
+    def test_valid_position_with_negative_x(self):
+        """Test shapes with empty leading columns may sit at negative x."""
+        self.assertTrue(self.board.is_valid_position(make_piece(I_VERTICAL, -2, 0)))
+        self.assertFalse(self.board.is_valid_position(make_piece(I_VERTICAL, -3, 0)))
+        self.assertTrue(self.board.is_valid_position(make_piece(I_VERTICAL, 7, 0)))
+        self.assertFalse(self.board.is_valid_position(make_piece(I_VERTICAL, 8, 0)))
+
+    def test_in_bounds(self):
+        """Test the wall and floor check ignores placed blocks."""
+        self.board.place_piece(make_piece(O_SHAPE, 0, 18))
+
+        self.assertTrue(self.board.in_bounds(make_piece(O_SHAPE, -1, 17)))
+        self.assertFalse(self.board.in_bounds(make_piece(O_SHAPE, -2, 0)))
+        self.assertFalse(self.board.in_bounds(make_piece(O_SHAPE, 9, 0)))
+        self.assertFalse(self.board.in_bounds(make_piece(I_VERTICAL, 0, 17)))
+
+    def test_valid_position_above_board(self):
+        """Test cells above the visible board are allowed."""
+        self.assertTrue(self.board.is_valid_position(make_piece(I_VERTICAL, 0, -3)))
+
+    def test_valid_offset(self):
+        """Test offset checks match checking the moved piece."""
+        self.board.place_piece(make_piece(O_SHAPE, 0, 18))
+        piece = make_piece(O_SHAPE, 0, 15)
+
+        self.assertTrue(self.board.is_valid_offset(piece, 0, 1))
+        self.assertFalse(self.board.is_valid_offset(piece, 0, 2))
+        self.assertTrue(self.board.is_valid_offset(piece, -1, 0))
+        self.assertFalse(self.board.is_valid_offset(piece, -2, 0))
+
+    def test_collision(self):
+        """Test collision with placed blocks."""
+        self.board.place_piece(make_piece(O_SHAPE, 0, 18, color=3))
+
+        self.assertFalse(self.board.is_valid_position(make_piece(O_SHAPE, 0, 17)))
+        self.assertTrue(self.board.is_valid_position(make_piece(O_SHAPE, 0, 16)))
+        self.assertTrue(self.board.is_valid_position(make_piece(O_SHAPE, 2, 18)))
+
+    def test_place_piece(self):
+        """Test placing a piece writes its color."""
+        self.board.place_piece(make_piece(I_HORIZONTAL, 2, 18, color=6))
+        board = self.board.get_board()
+
+        self.assertEqual(board[19][2:6], [6, 6, 6, 6])
+        self.assertEqual(board[19][6], 0)
+
+    def test_place_invalid_piece(self):
+        """Test placing a piece at an invalid position."""
+        with self.assertRaises(ValueError):
+            self.board.place_piece(make_piece(I_HORIZONTAL, 8, 0))
+
+    def test_get_board_returns_copy(self):
+        """Test get_board does not expose internal state."""
+        board = self.board.get_board()
+        board[19][0] = 5
+
+        self.assertEqual(self.board.get_board()[19][0], 0)
+
+    def test_get_board_with_piece(self):
+        """Test overlaying a piece leaves the board untouched."""
+        overlay = self.board.get_board_with_piece(make_piece(O_SHAPE, 0, 0, color=3))
+
+        self.assertEqual(overlay[0][:4], [0, 3, 3, 0])
+        self.assertEqual(overlay[1][:4], [0, 3, 3, 0])
+        self.assertEqual(self.board.get_board()[0][1], 0)
+
+    def test_get_board_with_ghost(self):
+        """Test the ghost is drawn under the active piece in the ghost color."""
+        piece = make_piece(O_SHAPE, 0, 0, color=3)
+        ghost = self.board.get_ghost_piece_position(piece)
+        overlay = self.board.get_board_with_ghost(piece, ghost)
+
+        self.assertEqual(overlay[0][1], 3)
+        self.assertEqual(overlay[18][1:3], [self.board.ghost_color] * 2)
+
+    def test_clear_completed_lines(self):
+        """Test clearing full lines shifts remaining rows down."""
+        self.fill_row(19)
+        self.fill_row(18, skip=(4,))
+        self.board.place_piece(make_piece([[1]], 0, 17, color=2))
+
+        cleared = self.board.clear_completed_lines()
+        board = self.board.get_board()
+
+        self.assertEqual(cleared, 1)
+        self.assertEqual(board[19][4], 0)
+        self.assertEqual(board[19][0], 1)
+        self.assertEqual(board[18][0], 2)
+        self.assertTrue(all(cell == 0 for cell in board[0]))
+
+    def test_clear_multiple_lines(self):
+        """Test clearing several non-adjacent full lines."""
+        self.fill_row(19)
+        self.fill_row(18, skip=(0,))
+        self.fill_row(17)
+
+        self.assertEqual(self.board.clear_completed_lines(), 2)
+        board = self.board.get_board()
+        self.assertEqual(board[19][0], 0)
+        self.assertEqual(board[19][1], 1)
+        self.assertTrue(all(cell == 0 for cell in board[18]))
+
+    def test_ghost_piece_position(self):
+        """Test ghost piece lands on the stack."""
+        ghost = self.board.get_ghost_piece_position(make_piece(O_SHAPE, 0, 0))
+        self.assertEqual(ghost.y, 18)
+
+        self.board.place_piece(make_piece(O_SHAPE, 0, 18))
+        ghost = self.board.get_ghost_piece_position(make_piece(O_SHAPE, 0, 0))
+        self.assertEqual(ghost.y, 16)
+
+    def test_ghost_piece_under_overhang(self):
+        """Test ghost drop ignores blocks above the piece."""
+        self.board.place_piece(make_piece([[1]], 1, 10))
+        piece = make_piece(O_SHAPE, 0, 12)
+
+        ghost = self.board.get_ghost_piece_position(piece)
+        self.assertEqual(ghost.y, 18)
+
+    def test_is_game_over(self):
+        """Test game over detection on the top row."""
+        self.assertFalse(self.board.is_game_over())
+
+        self.board.place_piece(make_piece([[1]], 5, 0))
+        self.assertTrue(self.board.is_game_over())
+
+    def test_line_heights_and_holes(self):
+        """Test column heights and hole counting."""
+        self.board.place_piece(make_piece([[1]], 0, 17))
+        self.board.place_piece(make_piece([[1]], 0, 19))
+        self.board.place_piece(make_piece([[1]], 3, 19))
+
+        heights = self.board.get_line_heights()
+        self.assertEqual(heights[0], 3)
+        self.assertEqual(heights[3], 1)
+        self.assertEqual(heights[1], 0)
+        self.assertEqual(self.board.get_holes_count(), 1)
+
+    def test_line_heights_after_clear(self):
+        """Test column heights follow rows shifted by a line clear."""
+        self.fill_row(19)
+        self.board.place_piece(make_piece([[1]], 2, 18))
+        self.board.place_piece(make_piece([[1]], 2, 16))
+        self.board.clear_completed_lines()
+
+        heights = self.board.get_line_heights()
+        self.assertEqual(heights[2], 3)
+        self.assertEqual(heights[0], 0)
+
+    def test_board_statistics(self):
+        """Test board statistics summary."""
+        self.board.place_piece(make_piece(O_SHAPE, 0, 18))
+        stats = self.board.get_board_statistics()
+
+        self.assertEqual(stats["filled_cells"], 4)
+        self.assertEqual(stats["empty_cells"], 196)
+        self.assertEqual(stats["holes"], 0)
+        self.assertFalse(stats["top_row_filled"])
+
+    @unittest.skipIf(game_board.np is None, "numpy is not installed")
+    def test_board_statistics_numpy_matches_python(self):
+        """Test the NumPy statistics path returns the same dict as the pure-Python one."""
+        self.fill_row(19, skip=(4,))
+        self.board.place_piece(make_piece(O_SHAPE, 3, 16, color=3))
+        self.board.place_piece(make_piece(I_VERTICAL, 5, 10))
+
+        with_numpy = self.board.get_board_statistics()
+        with mock.patch.object(game_board, 'np', None):
+            without_numpy = self.board.get_board_statistics()
+
+        self.assertEqual(with_numpy, without_numpy)
+        self.assertEqual({key: type(value) for key, value in with_numpy.items()},
+                         {key: type(value) for key, value in without_numpy.items()})
+        self.assertEqual(without_numpy["holes"], 8)
+
+    def test_simulate_lock(self):
+        """Test lock simulation scores a drop without touching the board."""
+        self.fill_row(19, skip=(0, 1, 2, 3))
+        piece = make_piece(I_HORIZONTAL, 0, 0)
+
+        rows, lines, holes, height = self.board.simulate_lock(piece)
+
+        self.assertEqual(lines, 1)
+        self.assertEqual(holes, 0)
+        self.assertEqual(height, 0)
+        self.assertTrue(all(bits == 0 for bits in rows))
+        self.assertEqual(self.board.get_board()[19][5], 1)
+
+    def test_simulate_lock_counts_holes(self):
+        """Test lock simulation reports holes left under the piece."""
+        self.board.place_piece(make_piece([[1]], 0, 19))
+        piece = make_piece(O_SHAPE, -1, 0)
+
+        rows, lines, holes, height = self.board.simulate_lock(piece)
+
+        self.assertEqual(lines, 0)
+        self.assertEqual(holes, 1)
+        self.assertEqual(height, 3)
+        self.assertEqual(rows[17], 0b11)
+
+    def test_reset(self):
+        """Test reset empties the board."""
+        self.board.place_piece(make_piece(O_SHAPE, 0, 18))
+        self.board.reset()
+
+        self.assertTrue(all(cell == 0 for row in self.board.get_board() for cell in row))
+        self.assertTrue(self.board.is_valid_position(make_piece(O_SHAPE, 0, 18)))
+
+
+if __name__ == '__main__':
+    unittest.main()
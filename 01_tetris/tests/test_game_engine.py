@@ -0,0 +1,112 @@
+"""Tests for game engine scoring."""
+
+import unittest
+from unittest import mock
+from core.config_manager import ConfigManager
+from core.dependency_injection import Container
+from core.input_actions import InputAction
+from core.game_state import TetrominoState
+from interfaces.game_interfaces import (
+    IGameEngine, IRenderer, IInputHandler, IGameBoard, ITetrominoFactory, IScoreCalculator
+)
+from components.game_board import GameBoard
+from components.game_engine import ScoreCalculator, TetrisGameEngine
+from components.tetromino_factory import TetrominoFactory
+
+
+class TestScoreCalculator(unittest.TestCase):
+    """Test cases for ScoreCalculator."""
+
+    def setUp(self):
+        """Set up test environment."""
+        container = Container()
+        container.register_instance(ConfigManager, ConfigManager())
+        self.calculator = ScoreCalculator()
+        self.calculator.initialize(container)
+
+    def test_line_score(self):
+        """Test line scores scale with level."""
+        self.assertEqual(self.calculator.calculate_line_score(1, 1), 40)
+        self.assertEqual(self.calculator.calculate_line_score(4, 2), 2400)
+        self.assertEqual(self.calculator.calculate_line_score(0, 3), 0)
+        self.assertEqual(self.calculator.calculate_line_score(5, 1), 0)
+
+    def test_level(self):
+        """Test level advances every ten lines."""
+        self.assertEqual(self.calculator.calculate_level(0), 1)
+        self.assertEqual(self.calculator.calculate_level(10), 2)
+        self.assertEqual(self.calculator.calculate_level(25), 3)
+
+    def test_fall_speed(self):
+        """Test fall speed decreases with level down to the minimum."""
+        self.assertEqual(self.calculator.calculate_fall_speed(1), 500)
+        self.assertEqual(self.calculator.calculate_fall_speed(3), 400)
+        self.assertEqual(self.calculator.calculate_fall_speed(50), 50)
+
+
+class TestTetrisGameEngine(unittest.TestCase):
+    """Test cases for TetrisGameEngine driven through real board and factory."""
+
+    def setUp(self):
+        """Set up test environment."""
+        container = Container()
+        container.register_instance(ConfigManager, ConfigManager())
+        container.register_instance(IRenderer, mock.Mock(spec=IRenderer))
+        container.register_instance(IInputHandler, mock.Mock(spec=IInputHandler))
+        container.register_singleton(IScoreCalculator, ScoreCalculator)
+        container.register_singleton(ITetrominoFactory, TetrominoFactory)
+        container.register_singleton(IGameBoard, GameBoard)
+        container.register_singleton(IGameEngine, TetrisGameEngine)
+        container.initialize()
+
+        self.engine = container.get(IGameEngine)
+        self.board = container.get(IGameBoard)
+        self.factory = container.get(ITetrominoFactory)
+        self.engine.start_game()
+
+    def use_piece(self, piece):
+        """Make piece the current piece."""
+        ghost = self.board.get_ghost_piece_position(piece)
+        self.engine.state_manager.set_piece(piece, ghost, 0, 0)
+
+    def vertical_i_at_left_wall(self):
+        """Fill the bottom row except column 0 and push a vertical I into the left wall."""
+        for x in range(1, 10):
+            self.board.place_piece(TetrominoState("O", x, 19, 0, [[1]], 3))
+        self.use_piece(self.factory.rotate_piece(self.factory.create_piece("I"), "right"))
+
+        for _ in range(10):
+            self.engine.handle_input(InputAction.MOVE_LEFT)
+
+        state = self.engine.get_current_state()
+        self.assertEqual(state.current_piece.x, -2)
+        self.assertEqual(state.ghost_piece.y, 16)
+
+    def test_hard_drop_at_left_wall_clears_line(self):
+        """Test a vertical I hard-dropped at negative x locks and credits the clear."""
+        self.vertical_i_at_left_wall()
+        self.engine.handle_input(InputAction.HARD_DROP)
+
+        state = self.engine.get_current_state()
+        self.assertEqual(state.lines_cleared, 1)
+        self.assertEqual(state.score, 16 * 2 + 40)
+        self.assertEqual([row[0] for row in self.board.get_board()[17:]], [6, 6, 6])
+        self.assertEqual(state.board, self.board.get_board())
+
+    def test_gravity_lock_at_left_wall_clears_line(self):
+        """Test a grounded vertical I at negative x locks through the lock delay."""
+        self.vertical_i_at_left_wall()
+        state = self.engine.get_current_state()
+        self.use_piece(state.ghost_piece)
+        self.engine.state_manager.set_grounded(lock_timer=1)
+
+        self.engine.update(0)
+
+        state = self.engine.get_current_state()
+        self.assertEqual(state.lines_cleared, 1)
+        self.assertEqual(state.score, 40)
+        self.assertEqual([row[0] for row in self.board.get_board()[17:]], [6, 6, 6])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -66,6 +66,37 @@ class TestGameStateManager(unittest.TestCase):
         
         self.assertEqual(new_state.score, initial_score + 50)
     
+    def test_piece_mutators(self):
+        """Test narrow piece mutators update lock state and history."""
+        piece = TetrominoState("O", 3, 5, 0, [[1, 1], [1, 1]], 3)
+        ghost = TetrominoState("O", 3, 18, 0, [[1, 1], [1, 1]], 3)
+        
+        state = self.manager.set_grounded(1000)
+        self.assertTrue(state.is_grounded)
+        self.assertEqual(state.lock_timer, 1000)
+        
+        state = self.manager.set_piece(piece, ghost, 2, 1500)
+        self.assertEqual(state.current_piece, piece)
+        self.assertEqual(state.move_resets, 2)
+        self.assertTrue(state.is_grounded)
+        
+        state = self.manager.apply_move(piece, ghost)
+        self.assertFalse(state.is_grounded)
+        self.assertEqual(state.lock_timer, 0)
+        self.assertEqual(state.move_resets, 0)
+        self.assertEqual(self.manager.get_previous_state().lock_timer, 1500)
+    
+    def test_epoch_advances_on_change(self):
+        """Test the epoch counter moves with every state change."""
+        start = self.manager.epoch
+        
+        self.manager.update_state(score=10)
+        self.manager.set_grounded(500)
+        self.assertEqual(self.manager.epoch, start + 2)
+        
+        self.manager.reset_game()
+        self.assertEqual(self.manager.epoch, start + 3)
+    
     def test_clear_lines(self):
         """Test line clearing update."""
         initial_lines = self.manager.current_state.lines_cleared
@@ -73,6 +104,18 @@ class TestGameStateManager(unittest.TestCase):
         
         self.assertEqual(new_state.lines_cleared, initial_lines + 2)
     
+    def test_apply_lock(self):
+        """Test a lock credits points and lines in one state change."""
+        start = self.manager.epoch
+        self.manager.update_state(lines_cleared=8)
+        
+        state = self.manager.apply_lock(140, 3, is_grounded=False)
+        self.assertEqual(state.score, 140)
+        self.assertEqual(state.lines_cleared, 11)
+        self.assertEqual(state.level, 2)
+        self.assertEqual(state.fall_speed, 450)
+        self.assertEqual(self.manager.epoch, start + 2)
+    
     def test_invalid_board_state(self):
         """Test invalid board state validation."""
         invalid_board = [[1, 2], [3]]  # Inconsistent row lengths
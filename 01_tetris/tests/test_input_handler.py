@@ -0,0 +1,131 @@
+"""Tests for input handler."""
+
+import unittest
+from unittest import mock
+from core.config_manager import ConfigManager, ControlsConfig
+from core.dependency_injection import Container
+from core.event_system import EventHandler, EventType
+from core.input_actions import InputAction
+from components.input_handler import CursesInputHandler
+
+
+class TestCursesInputHandler(unittest.TestCase):
+    """Test cases for CursesInputHandler."""
+
+    def setUp(self):
+        """Set up test environment."""
+        container = Container()
+        container.register_instance(ConfigManager, ConfigManager())
+        self.stdscr = mock.Mock()
+        self.handler = CursesInputHandler(self.stdscr, skip_input_setup=True)
+        self.handler.initialize(container)
+
+    def press(self, key):
+        """Feed one key press and return the mapped action."""
+        self.stdscr.getch.return_value = ord(key)
+        return self.handler.get_input()
+
+    def test_keys_map_to_actions(self):
+        """Test configured keys translate to input actions."""
+        self.assertIs(self.press('a'), InputAction.MOVE_LEFT)
+        self.assertIs(self.press(' '), InputAction.HARD_DROP)
+        self.assertIsNone(self.press('z'))
+
+    def test_duplicate_binding_keeps_config_order(self):
+        """Test a key bound to several actions maps to the last one in config order."""
+        config_manager = mock.Mock(spec=ConfigManager)
+        config_manager.controls = ControlsConfig(move_left=['x'], pause=['x'], quit=['x', 'y'],
+                                                 rotate_left=['y'])
+        container = Container()
+        container.register_instance(ConfigManager, config_manager)
+        self.handler = CursesInputHandler(self.stdscr, skip_input_setup=True)
+        self.handler.initialize(container)
+
+        self.assertIs(self.press('x'), InputAction.QUIT)
+        self.assertIs(self.press('y'), InputAction.QUIT)
+        self.assertIs(self.press('d'), InputAction.MOVE_RIGHT)
+
+    def test_quit_and_pause_flags(self):
+        """Test quit and pause actions set request flags."""
+        self.press('p')
+        self.press('Q')
+
+        self.assertTrue(self.handler.is_pause_requested())
+        self.assertTrue(self.handler.is_quit_requested())
+
+        self.handler.reset_state()
+        self.assertFalse(self.handler.is_pause_requested())
+        self.assertFalse(self.handler.is_quit_requested())
+
+    def test_poll_once_feeds_accessors(self):
+        """Test accessors read the cached poll instead of reading keys again."""
+        self.stdscr.getch.return_value = ord(' ')
+        self.handler.poll_once()
+
+        self.assertTrue(self.handler.is_hard_drop_requested())
+        self.assertIsNone(self.handler.get_movement_input())
+        self.assertEqual(self.stdscr.getch.call_count, 1)
+
+    def test_input_event_payload_reused(self):
+        """Test repeated presses of a key publish the same payload object."""
+        received = []
+
+        class Listener(EventHandler):
+            def handle_event(self, event):
+                received.append(event.data)
+
+            def get_handled_events(self):
+                return [EventType.INPUT_RECEIVED]
+
+        listener = Listener()
+        self.handler.event_bus.subscribe_multiple(listener)
+        try:
+            self.press('a')
+            self.press('a')
+        finally:
+            self.handler.event_bus.unsubscribe(EventType.INPUT_RECEIVED, listener)
+
+        self.assertIs(received[0], received[1])
+        self.assertEqual(received[0], {"action": InputAction.MOVE_LEFT, "raw_key": ord('a')})
+
+    def test_idle_poll_only_reads_key(self):
+        """Test an idle poll reads once and leaves the timeout alone."""
+        self.stdscr.getch.return_value = -1
+        self.handler.get_input(100)
+        self.stdscr.timeout.reset_mock()
+
+        self.assertIsNone(self.handler.get_input(100))
+        self.stdscr.timeout.assert_not_called()
+
+    def test_default_mappings_cover_both_cases(self):
+        """Test fallback mappings accept upper and lower case letters."""
+        self.handler.config_manager = None
+        self.handler.reload_mappings()
+
+        self.assertIs(self.press('q'), InputAction.QUIT)
+        self.assertIs(self.press('D'), InputAction.MOVE_RIGHT)
+        self.assertIs(self.press(' '), InputAction.HARD_DROP)
+        self.assertEqual(self.handler.validate_key_mappings(), [])
+
+    def test_add_key_mapping(self):
+        """Test mappings added by config name resolve to actions."""
+        self.assertNotIn('x', self.handler.get_all_mappings())
+        self.handler.add_key_mapping('x', 'rotate_left')
+
+        self.assertIs(self.press('x'), InputAction.ROTATE_LEFT)
+        self.assertEqual(self.handler.get_all_mappings()['x'], 'rotate_left')
+        self.assertEqual(self.handler.validate_key_mappings(), [])
+
+        self.handler.remove_key_mapping('x')
+        self.assertNotIn('x', self.handler.get_all_mappings())
+
+    def test_key_past_table_uses_mappings(self):
+        """Test key codes beyond the flat lookup table still resolve."""
+        self.handler.add_key_mapping('\u07d0', 'pause')
+
+        self.assertIs(self.press('\u07d0'), InputAction.PAUSE)
+        self.assertIsNone(self.press('\u07d1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
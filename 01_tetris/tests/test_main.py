@@ -0,0 +1,43 @@
+"""Tests for the main application loop."""
+
+import unittest
+from unittest import mock
+from core.input_actions import InputAction
+from interfaces.game_interfaces import IGameEngine, IInputHandler
+from main import GameApplication
+
+
+class TestGameApplication(unittest.TestCase):
+    """Test cases for GameApplication."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.engine = mock.Mock(spec=IGameEngine)
+        self.engine.is_running.return_value = True
+        self.input_handler = mock.Mock(spec=IInputHandler)
+
+        self.app = GameApplication(mock.Mock())
+        self.app.container = mock.Mock()
+        self.app.container.get.side_effect = lambda interface: {
+            IGameEngine: self.engine,
+            IInputHandler: self.input_handler
+        }.get(interface, mock.Mock())
+
+    def test_quit_key_stops_loop(self):
+        """Test the quit action is dispatched and ends the main loop."""
+        # A second poll would mean QUIT was dropped; interrupt so the test cannot hang
+        self.input_handler.poll_once.side_effect = [InputAction.QUIT, KeyboardInterrupt]
+
+        with mock.patch.object(self.app, 'setup_dependencies'):
+            self.app.run()
+
+        self.engine.handle_input.assert_called_once_with(InputAction.QUIT)
+        self.assertEqual(self.input_handler.poll_once.call_count, 1)
+
+    def test_actions_are_truthy(self):
+        """Test every action survives truthiness checks in callers."""
+        self.assertTrue(all(InputAction))
+
+
+if __name__ == '__main__':
+    unittest.main()
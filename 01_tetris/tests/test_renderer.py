@@ -0,0 +1,114 @@
+"""Tests for curses renderer."""
+
+import unittest
+from unittest import mock
+from core.game_state import GameState, GameStatus, TetrominoState
+from components.renderer import CursesRenderer
+
+
+O_SHAPE = [[0, 1, 1, 0], [0, 1, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+
+def make_state(score=0, x=3):
+    """Create a playing state with one O piece."""
+    piece = TetrominoState(shape_type="O", x=x, y=0, rotation=0, shape=O_SHAPE, color=3)
+    return GameState(status=GameStatus.PLAYING, current_piece=piece, score=score)
+
+
+class TestCursesRenderer(unittest.TestCase):
+    """Test cases for CursesRenderer."""
+
+    def setUp(self):
+        """Set up test environment."""
+        self.curses_calls = {}
+        # No terminal under test: fake the curses calls made during setup and refresh
+        fakes = {'color_pair': lambda n: n << 8, 'has_colors': lambda: True}
+        for name in ('color_pair', 'has_colors', 'doupdate', 'curs_set', 'noecho', 'cbreak',
+                     'start_color', 'init_pair'):
+            patcher = mock.patch('curses.' + name, side_effect=fakes.get(name, lambda *args: None))
+            self.curses_calls[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.stdscr = mock.Mock()
+        self.stdscr.getmaxyx.return_value = (30, 60)
+        self.renderer = CursesRenderer(self.stdscr)
+        self.renderer.initialize_renderer()
+
+    def test_setup_configures_terminal(self):
+        """Test initialization hides the cursor and sets up colors."""
+        self.curses_calls['curs_set'].assert_called_once_with(0)
+        self.curses_calls['start_color'].assert_called_once()
+        self.stdscr.keypad.assert_called_once_with(True)
+        self.stdscr.leaveok.assert_called_once_with(True)
+
+    def written(self):
+        """Return the text written since the last call, keyed by position."""
+        cells = {(c.args[0], c.args[1]): c.args[2] for c in self.stdscr.addstr.call_args_list}
+        self.stdscr.addstr.reset_mock()
+        return cells
+
+    def test_first_frame_draws_everything(self):
+        """Test the first frame writes the board and panel in runs of one attribute."""
+        self.renderer.render_game(make_state())
+        cells = self.written()
+
+        self.assertEqual(cells[(3, 3)], '. . . .')
+        self.assertEqual(cells[(3, 11)], '[][]')
+        self.assertEqual(cells[(8, 25)], 'Score: 0')
+        self.stdscr.erase.assert_called_once()
+        self.stdscr.clear.assert_not_called()
+
+    def test_pieces_overlay_leaves_board_untouched(self):
+        """Test the piece and its ghost are drawn without mutating the state board."""
+        piece = make_state().current_piece
+        ghost = TetrominoState(shape_type="O", x=3, y=18, rotation=0, shape=O_SHAPE, color=3)
+        state = GameState(status=GameStatus.PLAYING, current_piece=piece, ghost_piece=ghost)
+        self.renderer.render_game(state)
+        cells = self.written()
+
+        self.assertEqual(cells[(3, 11)], '[][]')
+        self.assertEqual(cells[(21, 11)], '[][]')
+        self.assertTrue(all(cell == 0 for row in state.board for cell in row))
+
+    def test_unchanged_frame_writes_nothing(self):
+        """Test rendering an equal state again skips the frame entirely."""
+        self.renderer.render_game(make_state())
+        self.written()
+        self.renderer.render_game(make_state())
+
+        self.assertEqual(self.written(), {})
+        self.assertEqual(self.stdscr.noutrefresh.call_count, 1)
+
+    def test_changed_cells_only(self):
+        """Test a score change rewrites only the score digits."""
+        self.renderer.render_game(make_state(score=0))
+        self.written()
+        self.renderer.render_game(make_state(score=7))
+
+        self.assertEqual(self.written(), {(8, 32): '7'})
+
+    def test_static_chrome_drawn_once(self):
+        """Test border and help are drawn once and reused across frames."""
+        with mock.patch.object(self.renderer, 'render_controls_help',
+                               wraps=self.renderer.render_controls_help) as help_spy:
+            for score in range(3):
+                self.renderer.render_game(make_state(score=score))
+
+        help_spy.assert_called_once()
+        cells = self.written()
+        self.assertEqual(cells[(12, 25)], 'Controls:')
+        self.assertEqual(cells[(23, 2)], '-' * 22)
+
+    def test_resize_repaints(self):
+        """Test a terminal size change repaints from a blank screen."""
+        self.renderer.render_game(make_state())
+        self.written()
+        self.stdscr.getmaxyx.return_value = (40, 80)
+        self.renderer.render_game(make_state())
+
+        self.assertEqual(self.stdscr.erase.call_count, 2)
+        self.assertEqual(self.written()[(8, 25)], 'Score: 0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -70,6 +70,12 @@ class TestTetrominoFactory(unittest.TestCase):
         self.assertIn(piece.shape_type, ["I", "O"])
         self.assertIn(piece.color, [6, 3])
     
+    def test_random_pieces_dealt_in_bags(self):
+        """Test every type appears once in each bag of random pieces."""
+        for _ in range(3):
+            bag = {self.factory.create_random_piece().shape_type for _ in range(2)}
+            self.assertEqual(bag, {"I", "O"})
+    
     def test_get_available_types(self):
         """Test getting available piece types."""
         types = self.factory.get_available_types()
@@ -145,6 +151,12 @@ class TestTetrominoFactory(unittest.TestCase):
         for row in preview:
             for cell in row:
                 self.assertEqual(cell, 1)
+    
+    def test_get_piece_preview_rotation(self):
+        """Test previews are cropped per rotation."""
+        self.assertEqual(self.factory.get_piece_preview("I"), ((1, 1, 1, 1),))
+        self.assertEqual(self.factory.get_piece_preview("I", rotation=1), ((1,), (1,), (1,), (1,)))
+        self.assertEqual(self.factory.get_piece_preview("UNKNOWN"), ((0,),))
 
 
 if __name__ == '__main__':